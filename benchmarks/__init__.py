@@ -0,0 +1 @@
+"""Benchmarks for the MyLightSystems API client."""
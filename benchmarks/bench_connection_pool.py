@@ -0,0 +1,71 @@
+"""Compare a bare session with the client's tuned connection pool.
+
+Run with ``python -m benchmarks.bench_connection_pool``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from aiohttp import ClientSession, web
+
+from benchmarks.payloads import states_body
+from mylightsystems import MyLightSystemsApiClient
+
+REQUESTS = 5_000
+CONCURRENCY = 64
+BASE_URL = "http://localhost:8766"
+
+
+async def _serve(body: bytes) -> web.AppRunner:
+    """Serve `/api/states` on a local port."""
+
+    async def states(_request: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/api/states", states)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "localhost", 8766).start()
+    return runner
+
+
+async def _run(client: MyLightSystemsApiClient) -> float:
+    """Return the requests/sec sustained by a client."""
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def call(index: int) -> None:
+        async with semaphore:
+            # A token per call, so identical requests aren't coalesced
+            await client.get_states(f"token-{index}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(call(index) for index in range(REQUESTS)))
+    return REQUESTS / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    runner = await _serve(states_body(devices=8))
+
+    async with ClientSession() as session:
+        bare = await _run(MyLightSystemsApiClient(BASE_URL, session=session))
+    print(f"bare session: {bare:>10,.0f} requests/sec")
+
+    async with MyLightSystemsApiClient(BASE_URL) as client:
+        tuned = await _run(client)
+        stats = client.pool_stats
+    print(f"tuned pool:   {tuned:>10,.0f} requests/sec")
+    print(
+        f"              {stats.created} connections created, {stats.reused:,} "
+        f"reused ({stats.hit_ratio:.1%}), {stats.queued:,} queued, "
+        f"{stats.dns_cache_hits:,} DNS cache hits"
+    )
+
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,40 @@
+"""Compare per-call `strptime` with the cached date parser.
+
+Run with ``python -m benchmarks.bench_dates``.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+import timeit
+
+from mylightsystems.dates import API_DATE_FORMAT, parse_date
+
+# One /api/states response: sensors nearly all share the same date
+DATES = ["2024-07-28 18:03:14"] * 9_990 + [
+    f"2024-07-28 18:0{minute}:00" for minute in range(10)
+]
+
+
+def strptime() -> list[datetime]:
+    """Parse every date with `datetime.strptime`."""
+    return [
+        datetime.strptime(date, API_DATE_FORMAT).replace(tzinfo=UTC) for date in DATES
+    ]
+
+
+def cached() -> list[datetime]:
+    """Parse every date with the cached parser."""
+    return [parse_date(date) for date in DATES]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    assert strptime() == cached()  # noqa: S101
+    for name, func in (("strptime", strptime), ("cached", cached)):
+        best = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:>9}: {len(DATES) / best:>12,.0f} dates/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Compare the stdlib and orjson decoding paths on `/api/states` bodies.
+
+Run with ``python -m benchmarks.bench_decode``.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+import json
+import timeit
+from typing import TYPE_CHECKING
+
+import orjson
+
+from benchmarks.payloads import states_body
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SIZES = (100, 1_000, 5_000, 20_000)
+
+
+def stdlib_loads(body: bytes) -> object:
+    """Decode the way `ClientResponse.json()` does."""
+    return json.loads(body.decode("utf-8"))
+
+
+def best_of(loads: Callable[[bytes], object], body: bytes, number: int) -> float:
+    """Return the best time per call, in milliseconds."""
+    timer = timeit.Timer(partial(loads, body))
+    return min(timer.repeat(number=number, repeat=5)) / number * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(
+        f"{'devices':>8} {'KiB':>8} {'json (ms)':>10} {'orjson (ms)':>12} {'gain':>6}"
+    )
+    for devices in SIZES:
+        body = states_body(devices)
+        number = max(1, 20_000 // devices)
+        stdlib = best_of(stdlib_loads, body, number)
+        fast = best_of(orjson.loads, body, number)
+        print(
+            f"{devices:>8} {len(body) / 1024:>8.1f} {stdlib:>10.3f} "
+            f"{fast:>12.3f} {stdlib / fast:>5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
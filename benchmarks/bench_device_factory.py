@@ -0,0 +1,66 @@
+"""Compare the per-call and the generated device deserializers.
+
+Run with ``python -m benchmarks.bench_device_factory``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import timeit
+from typing import TYPE_CHECKING, Any
+
+from benchmarks.payloads import devices_payload
+from mylightsystems.device_factory import DeviceFactory, default_device_factory
+
+if TYPE_CHECKING:
+    from mylightsystems.models import Device
+
+DEVICES = 10_000
+
+
+FIELD_MAPPING = {
+    "deviceTypeId": "type_id",
+    "masterMac": "master_id",
+    "masterType": "master_type",
+    "reportPeriod": "report_period",
+    "batteryCapacity": "capacity",
+}
+VALUE_TRANSFORMERS: dict[str, Any] = {
+    "state": lambda x: x.lower() == "on",
+    "children": lambda x: {item["mac"]: item["phase"] for item in x},
+}
+
+
+def legacy_create_device(data: dict[str, Any]) -> Device:
+    """Build a device the way `get_devices` did with a per-call factory."""
+    device_class = DeviceFactory().get_device_class(data)
+    class_fields = {field.name for field in dataclasses.fields(device_class)}
+    device_data = {}
+    for json_field, value in data.items():
+        class_field = FIELD_MAPPING.get(json_field, json_field)
+        if class_field in class_fields:
+            if class_field in VALUE_TRANSFORMERS:
+                value = VALUE_TRANSFORMERS[class_field](value)  # noqa: PLW2901
+            device_data[class_field] = value
+    return device_class(**device_data)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    devices = devices_payload(DEVICES)["devices"]
+
+    def legacy() -> list[Device]:
+        return [legacy_create_device(device) for device in devices]
+
+    def compiled() -> list[Device]:
+        return [default_device_factory.create_device(device) for device in devices]
+
+    assert legacy() == compiled()  # noqa: S101
+
+    for name, func in (("legacy", legacy), ("generated", compiled)):
+        best = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{name:>9}: {DEVICES / best:>12,.0f} devices/sec")
+
+
+if __name__ == "__main__":
+    main()
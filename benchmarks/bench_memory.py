@@ -0,0 +1,49 @@
+"""Report the memory held by `DeviceState` snapshots.
+
+Run with ``python -m benchmarks.bench_memory``.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+
+import orjson
+
+from benchmarks.payloads import states_body
+from mylightsystems.models import DeviceState
+
+DEVICES = 10_000
+SENSORS = (1, 3, 10)
+
+
+def bytes_per_device_state(sensors: int, devices: int = DEVICES) -> float:
+    """Return the bytes allocated per `DeviceState` built from a payload.
+
+    The decoded payload is kept alive while measuring, so only the model
+    objects are accounted for and not the strings and floats they share
+    with it.
+    """
+    response = orjson.loads(states_body(devices, sensors))
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        device_states = [
+            DeviceState.from_dict(device_state)
+            for device_state in response["deviceStates"]
+        ]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(device_states) == devices  # noqa: S101
+    return (after - before) / devices
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"{'sensors':>8} {'bytes/DeviceState':>18}")
+    for sensors in SENSORS:
+        print(f"{sensors:>8} {bytes_per_device_state(sensors):>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compare hand-assembled and generated model deserializers on states.
+
+Run with ``python -m benchmarks.bench_models``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+import orjson
+
+from benchmarks.payloads import states_body
+from mylightsystems.dates import parse_date
+from mylightsystems.models import DeviceState, SensorMeasure, SensorState
+
+SIZES = (1_000, 10_000, 50_000)
+SENSORS = 3
+
+
+def hand_rolled(response: dict[str, Any]) -> list[DeviceState]:
+    """Build states the way `get_states` assembled them by hand."""
+    return [
+        DeviceState(
+            device_id=device_state["deviceId"],
+            report_period=device_state["effectiveReportPeriod"],
+            sensor_states=[
+                SensorState(
+                    sensor_id=sensor_state["sensorId"],
+                    measure=SensorMeasure(
+                        value=sensor_state["measure"]["value"],
+                        type=sensor_state["measure"].get("type", None),
+                        unit=sensor_state["measure"].get("unit", None),
+                        date=parse_date(sensor_state["measure"]["date"]),
+                    ),
+                )
+                for sensor_state in device_state["sensorStates"]
+            ],
+            state=device_state["state"].lower() == "on",
+        )
+        for device_state in response["deviceStates"]
+    ]
+
+
+def generated(response: dict[str, Any]) -> list[DeviceState]:
+    """Build states with the generated `from_dict`."""
+    return [
+        DeviceState.from_dict(device_state) for device_state in response["deviceStates"]
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"{'devices':>8} {'hand-rolled (ms)':>17} {'from_dict (ms)':>15}")
+    for devices in SIZES:
+        response = orjson.loads(states_body(devices, SENSORS))
+        assert hand_rolled(response) == generated(response)  # noqa: S101
+        timings = [
+            min(timeit.repeat(lambda: func(response), number=1, repeat=5)) * 1000  # noqa: B023
+            for func in (hand_rolled, generated)
+        ]
+        print(f"{devices:>8} {timings[0]:>17.1f} {timings[1]:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
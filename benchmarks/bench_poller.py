@@ -0,0 +1,83 @@
+"""Load test the poller against a local stand-in for the API.
+
+Run with ``python -m benchmarks.bench_poller``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from aiohttp import ClientSession, TCPConnector, web
+
+from benchmarks.payloads import states_body
+from mylightsystems import MyLightSystemsApiClient
+from mylightsystems.models import Auth
+from mylightsystems.poller import MyLightSystemsPoller, PollResult
+
+ACCOUNTS = 10_000
+REPORT_PERIOD = 5
+DURATION = 15
+CONCURRENCY = 64
+
+
+async def _serve(body: bytes) -> web.AppRunner:
+    """Serve `/api/states` on a local port."""
+
+    async def states(_request: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/api/states", states)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 8765).start()
+    return runner
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    body = states_body(devices=8, report_period=REPORT_PERIOD)
+    runner = await _serve(body)
+
+    polls = 0
+    errors = 0
+    lags: list[float] = []
+    expected: dict[str, float] = {}
+
+    def callback(result: PollResult) -> None:
+        nonlocal polls, errors
+        now = time.monotonic()
+        polls += 1
+        errors += not result.ok
+        if result.account in expected:
+            lags.append(now - expected[result.account])
+        expected[result.account] = now + REPORT_PERIOD
+
+    connector = TCPConnector(limit=CONCURRENCY)
+    async with ClientSession(connector=connector) as session:
+        client = MyLightSystemsApiClient("http://127.0.0.1:8765", session=session)
+        poller = MyLightSystemsPoller(
+            client, concurrency=CONCURRENCY, callback=callback
+        )
+        for index in range(ACCOUNTS):
+            poller.add_account(
+                f"account-{index}", Auth(token=f"token-{index}"), REPORT_PERIOD
+            )
+
+        async with poller:
+            await asyncio.sleep(DURATION)
+
+    await runner.cleanup()
+
+    lags.sort()
+    print(f"accounts:      {ACCOUNTS:>10,}")
+    print(f"polls:         {polls:>10,} ({polls / DURATION:,.0f}/sec)")
+    print(f"errors:        {errors:>10,}")
+    if lags:
+        print(f"lag p50 (ms):  {lags[len(lags) // 2] * 1000:>10.1f}")
+        print(f"lag p99 (ms):  {lags[int(len(lags) * 0.99)] * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
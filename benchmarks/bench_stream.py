@@ -0,0 +1,87 @@
+"""Compare the peak RSS of `get_states` and the streaming `iter_states`.
+
+Run with ``python -m benchmarks.bench_stream``. Each path runs in its own
+process, since the peak RSS of a process never goes down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import resource
+import subprocess
+import sys
+
+from aiohttp import web
+
+from benchmarks.payloads import states_body
+from mylightsystems import MyLightSystemsApiClient
+
+DEVICES = (1_000, 10_000, 50_000)
+SENSORS = 3
+BASE_URL = "http://localhost:8767"
+
+
+def _peak_rss_mb() -> float:
+    """Return the peak RSS of the process, in MB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _serve(devices: int) -> web.AppRunner:
+    """Serve `/api/states` on a local port."""
+    body = states_body(devices, SENSORS)
+
+    async def states(_request: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/api/states", states)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "localhost", 8767).start()
+    return runner
+
+
+async def _consume(path: str) -> int:
+    """Read every state with one path, keeping none of them."""
+    count = 0
+    async with MyLightSystemsApiClient(BASE_URL) as client:
+        if path == "stream":
+            async for _ in client.iter_states("token"):
+                count += 1
+        else:
+            count = len(await client.get_states("token"))
+    return count
+
+
+def _child(path: str) -> None:
+    """Print the RSS growth of consuming the states with one path."""
+    before = _peak_rss_mb()
+    asyncio.run(_consume(path))
+    print(_peak_rss_mb() - before)
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    print(f"{'devices':>8} {'get_states MB':>14} {'iter_states MB':>15}")
+    for devices in DEVICES:
+        runner = await _serve(devices)
+        growth = []
+        for path in ("buffered", "stream"):
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-m",
+                "benchmarks.bench_stream",
+                path,
+                stdout=subprocess.PIPE,
+            )
+            stdout, _ = await process.communicate()
+            growth.append(float(stdout))
+        print(f"{devices:>8,} {growth[0]:>14.1f} {growth[1]:>15.1f}")
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        _child(sys.argv[1])
+    else:
+        asyncio.run(main())
@@ -0,0 +1,108 @@
+"""Synthetic payloads shaped like the MyLightSystems API responses."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import orjson
+
+_DATE = "2024-07-28 18:03:14"
+
+
+def states_payload(
+    devices: int, sensors: int = 1, seed: int = 0, report_period: int = 150
+) -> dict[str, Any]:
+    """Build a `/api/states` payload with the given number of devices."""
+    rnd = random.Random(seed)
+    return {
+        "status": "ok",
+        "deviceStates": [
+            {
+                "deviceId": f"{index:012X}",
+                "effectiveReportPeriod": report_period,
+                "state": rnd.choice(("on", "off")),
+                "sensorStates": [
+                    {
+                        "sensorId": f"{index:012X}-pow{sensor}",
+                        "measure": {
+                            "value": round(rnd.uniform(-3000, 3000), 2),
+                            "type": "electric_power",
+                            "unit": "watt",
+                            "date": _DATE,
+                        },
+                    }
+                    for sensor in range(sensors)
+                ],
+                "actuatorStates": [],
+            }
+            for index in range(devices)
+        ],
+    }
+
+
+def states_body(
+    devices: int, sensors: int = 1, seed: int = 0, report_period: int = 150
+) -> bytes:
+    """Build a serialized `/api/states` body."""
+    return orjson.dumps(states_payload(devices, sensors, seed, report_period))
+
+
+def devices_payload(devices: int, seed: int = 0) -> dict[str, Any]:
+    """Build a `/api/devices` payload mixing every device type."""
+    rnd = random.Random(seed)
+    extra = {
+        "module_number": 0,
+        "unit_electric_capacity": 0,
+        "time": "2024-07-28 11:05:39Z",
+        "typeOverride": None,
+        "preProcessingEpsilon": 0.0,
+        "deviceTypeName": "Autre",
+        "powerColor": "#39b54a",
+        "programs": {},
+        "room": {"id": "9ZrdrIniODxvKecP", "name": "Habitation", "color": "#a1cbe1"},
+    }
+    templates: list[dict[str, Any]] = [
+        {"type": "sw", "masterMac": "F8DFE101A81C", "masterType": "mst"},
+        {"type": "cmp", "masterMac": "4D9F3081C75E", "masterType": "gmd", "phase": 1},
+        {
+            "type": "gmd",
+            "masterMac": "F8DFE101A81C",
+            "masterType": "mst",
+            "children": [{"mac": "B2F7E9A1C75E", "phase": 1}],
+        },
+        {"type": "vrt"},
+        {"type": "mst", "reportPeriod": 300},
+        {"type": "bat", "batteryCapacity": 100},
+    ]
+    return {
+        "status": "ok",
+        "devices": [
+            {
+                "id": f"{index:012X}",
+                "name": f"Device {index}",
+                "state": rnd.choice(("on", "off")),
+                "deviceTypeId": "other_device_type",
+                "power": round(rnd.uniform(-3000, 3000), 2),
+                **extra,
+                **templates[index % len(templates)],
+            }
+            for index in range(devices)
+        ],
+    }
+
+
+def measures_total_body(seed: int = 0) -> bytes:
+    """Build a serialized `/api/measures/total` body."""
+    rnd = random.Random(seed)
+    return orjson.dumps(
+        {
+            "status": "ok",
+            "measure": {
+                "values": [
+                    {"type": "power", "value": rnd.uniform(0, 1e8), "unit": "W"},
+                    {"type": "energy", "value": rnd.uniform(0, 1e11), "unit": "Ws"},
+                ]
+            },
+        }
+    )
@@ -0,0 +1,85 @@
+"""Throughput of the client on replayed synthetic payloads.
+
+Run with ``pytest --no-cov benchmarks``, and ``--benchmark-disable`` to
+only check they pass, as CI does. Responses are served from memory
+by a `ReplayTransport`, so no network is needed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import orjson
+import pytest
+
+from benchmarks.payloads import devices_payload, measures_total_body, states_body
+from mylightsystems import MyLightSystemsApiClient
+from mylightsystems.const import DEVICES_URL, MEASURES_TOTAL_URL, STATES_URL
+from mylightsystems.transport import ReplayTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+DEVICES = [10, 1_000, 10_000, 100_000]
+# One request per device, so fewer of them
+MEASURED_DEVICES = [10, 1_000]
+
+
+@pytest.fixture(name="runner")
+def runner_fixture() -> Generator[asyncio.Runner, None, None]:
+    """Return an event loop runner shared by the rounds of a benchmark."""
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.mark.parametrize("devices", DEVICES)
+def test_get_states(
+    benchmark: BenchmarkFixture, runner: asyncio.Runner, devices: int
+) -> None:
+    """Benchmark decoding and building the states."""
+    replay = ReplayTransport()
+    replay.add(STATES_URL, states_body(devices))
+    client = MyLightSystemsApiClient(transport=replay)
+
+    device_states = benchmark(lambda: runner.run(client.get_states("token")))
+
+    assert len(device_states) == devices
+
+
+@pytest.mark.parametrize("devices", DEVICES)
+def test_get_devices(
+    benchmark: BenchmarkFixture, runner: asyncio.Runner, devices: int
+) -> None:
+    """Benchmark decoding and building the devices."""
+    replay = ReplayTransport()
+    replay.add(DEVICES_URL, orjson.dumps(devices_payload(devices)))
+    client = MyLightSystemsApiClient(transport=replay)
+
+    result = benchmark(lambda: runner.run(client.get_devices("token")))
+
+    assert len(result) == devices
+
+
+@pytest.mark.parametrize("devices", MEASURED_DEVICES)
+def test_get_measures_total_many(
+    benchmark: BenchmarkFixture, runner: asyncio.Runner, devices: int
+) -> None:
+    """Benchmark the measures total of many devices."""
+    replay = ReplayTransport()
+    device_ids = [f"{index:012X}" for index in range(devices)]
+    for device_id in device_ids:
+        replay.add(
+            MEASURES_TOTAL_URL,
+            measures_total_body(),
+            params={"device_id": device_id},
+        )
+    client = MyLightSystemsApiClient(transport=replay)
+
+    results = benchmark(
+        lambda: runner.run(client.get_measures_total_many("token", device_ids, 32))
+    )
+
+    assert all(result.ok for result in results)
@@ -1,13 +1,26 @@
 """Asynchronous Python client for MyLightSystems API."""
 
-from mylightsystems.client import MyLightSystemsApiClient
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from mylightsystems.exceptions import (
     MyLightSystemsConnectionError,
     MyLightSystemsError,
     MyLightSystemsInvalidAuthError,
     MyLightSystemsUnauthorizedError,
 )
-from mylightsystems.models import Auth
+
+if TYPE_CHECKING:
+    from mylightsystems.client import MyLightSystemsApiClient  # noqa: TCH004
+    from mylightsystems.models import Auth  # noqa: TCH004
+
+# Imported on first access (PEP 562), as they pull in aiohttp and mashumaro
+_LAZY_ATTRIBUTES = {
+    "MyLightSystemsApiClient": "mylightsystems.client",
+    "Auth": "mylightsystems.models",
+}
 
 __all__ = [
     "MyLightSystemsApiClient",
@@ -17,3 +30,19 @@ __all__ = [
     "MyLightSystemsUnauthorizedError",
     "Auth",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the attributes of heavy modules when first accessed."""
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the attributes, including the ones not imported yet."""
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
@@ -0,0 +1,98 @@
+"""Bounded concurrent batches for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from mylightsystems.exceptions import MyLightSystemsConnectionError, MyLightSystemsError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True)
+class BatchResult(Generic[_T]):
+    """Represent the outcome of one call of a batch."""
+
+    key: str
+    value: _T | None = None
+    error: MyLightSystemsError | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True when the call succeeded."""
+        return self.error is None
+
+
+def _create_tasks(
+    func: Callable[[str], Awaitable[_T]],
+    keys: Iterable[str],
+    concurrency: int,
+) -> list[asyncio.Task[BatchResult[_T]]]:
+    """Schedule one task per key, at most `concurrency` running at once."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(key: str) -> BatchResult[_T]:
+        async with semaphore:
+            try:
+                return BatchResult(key=key, value=await func(key))
+            except MyLightSystemsError as exception:
+                return BatchResult(key=key, error=exception)
+
+    return [asyncio.create_task(_run(key)) for key in keys]
+
+
+async def _cancel(tasks: list[asyncio.Task[BatchResult[_T]]]) -> None:
+    """Cancel and reap the tasks still pending."""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def gather_bounded(
+    func: Callable[[str], Awaitable[_T]],
+    keys: Iterable[str],
+    concurrency: int,
+    timeout: float | None = None,
+) -> list[BatchResult[_T]]:
+    """Call `func` for every key and return the results in the keys order.
+
+    Errors of the API are captured in the result of their key, so one
+    failing call doesn't abort the others. Calls still running after
+    `timeout` seconds are cancelled and get a connection error.
+    """
+    keys = list(keys)
+    tasks = _create_tasks(func, keys, concurrency)
+    try:
+        if timeout is None:
+            return await asyncio.gather(*tasks)
+        await asyncio.wait(tasks, timeout=timeout)
+        return [
+            task.result()
+            if task.done()
+            else BatchResult(
+                key=key,
+                error=MyLightSystemsConnectionError("Deadline of the batch exceeded"),
+            )
+            for key, task in zip(keys, tasks, strict=True)
+        ]
+    finally:
+        await _cancel(tasks)
+
+
+async def iter_bounded(
+    func: Callable[[str], Awaitable[_T]],
+    keys: Iterable[str],
+    concurrency: int,
+) -> AsyncGenerator[BatchResult[_T], None]:
+    """Call `func` for every key and yield the results as they complete."""
+    tasks = _create_tasks(func, keys, concurrency)
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        await _cancel(tasks)
@@ -0,0 +1,130 @@
+"""Response cache for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import time
+from typing import TYPE_CHECKING, Any
+
+from mylightsystems.const import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_DEVICES_CACHE_TTL,
+    DEFAULT_PROFILE_CACHE_TTL,
+    DEFAULT_REPORT_PERIOD,
+    DEVICES_URL,
+    PROFILE_URL,
+    STATES_URL,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+CacheKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+
+def request_key(uri: str, params: Mapping[str, Any] | None) -> CacheKey:
+    """Return the key identifying a request."""
+    return (uri, tuple(sorted(params.items())) if params else ())
+
+
+@dataclass(slots=True)
+class _Entry:
+    """Cached response and its expiry."""
+
+    response: Any
+    expires_at: float
+
+
+@dataclass
+class ResponseCache:
+    """Size-bounded LRU cache of decoded API responses.
+
+    States expire after the smallest ``effectiveReportPeriod`` they report,
+    unless ``states_ttl`` is set. Devices and profile, which rarely change,
+    are kept longer. Every invalidation bumps ``generation``, so a response
+    fetched while one happened can be left out of the cache.
+    """
+
+    max_size: int = DEFAULT_CACHE_SIZE
+    states_ttl: float | None = None
+    devices_ttl: float = DEFAULT_DEVICES_CACHE_TTL
+    profile_ttl: float = DEFAULT_PROFILE_CACHE_TTL
+    clock: Callable[[], float] = time.monotonic
+    hits: int = 0
+    misses: int = 0
+    generation: int = 0
+    _entries: OrderedDict[CacheKey, _Entry] = field(default_factory=OrderedDict)
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    key = staticmethod(request_key)
+
+    def ttl(self, uri: str, response: Any) -> float | None:
+        """Return how long a response may be cached, None if it may not."""
+        if uri == STATES_URL:
+            if self.states_ttl is not None:
+                return self.states_ttl
+            return min(
+                (state["effectiveReportPeriod"] for state in response["deviceStates"]),
+                default=DEFAULT_REPORT_PERIOD,
+            )
+        if uri == DEVICES_URL:
+            return self.devices_ttl
+        if uri == PROFILE_URL:
+            return self.profile_ttl
+        return None
+
+    def get(self, key: CacheKey) -> Any | None:
+        """Return a fresh cached response, or None."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > self.clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.response
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, key: CacheKey, response: Any, ttl: float | None) -> None:
+        """Cache a response, evicting the least recently used ones."""
+        if ttl is None or ttl <= 0:
+            return
+        self._entries[key] = _Entry(response, self.clock() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, predicate: Callable[[CacheKey, Any], bool]) -> int:
+        """Drop the responses matching a predicate, return how many."""
+        self.generation += 1
+        keys = [
+            key
+            for key, entry in self._entries.items()
+            if predicate(key, entry.response)
+        ]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def invalidate_device(self, device_id: str) -> int:
+        """Drop the cached states and devices which include a device."""
+
+        def _includes(key: CacheKey, response: Any) -> bool:
+            if key[0] == STATES_URL:
+                return any(
+                    state["deviceId"] == device_id for state in response["deviceStates"]
+                )
+            if key[0] == DEVICES_URL:
+                return any(device["id"] == device_id for device in response["devices"])
+            return False
+
+        return self.invalidate(_includes)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self.generation += 1
+        self._entries.clear()
@@ -0,0 +1,76 @@
+"""Change detection over successive states for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from mylightsystems.models import DeviceState
+
+# Last "on"/"off" state of a device and (date, value) reading of its sensors
+_Snapshot = tuple[str, dict[str, tuple[str, float]]]
+
+
+def _changed_sensors(
+    sensor_states: list[dict[str, Any]],
+    last_readings: dict[str, tuple[str, float]],
+    readings: dict[str, tuple[str, float]],
+) -> list[dict[str, Any]]:
+    """Return the sensor states with a new reading, fill in ``readings``."""
+    changed = []
+    for sensor_state in sensor_states:
+        measure = sensor_state["measure"]
+        reading = (measure["date"], measure["value"])
+        last_reading = last_readings.get(sensor_state["sensorId"])
+        if last_reading is not None and reading[0] == last_reading[0]:
+            # Same reading, whatever its value
+            reading = last_reading
+        elif last_reading is None or reading[1] != last_reading[1]:
+            changed.append(sensor_state)
+        readings[sensor_state["sensorId"]] = reading
+    return changed
+
+
+@dataclass
+class StatesTracker:
+    """Keep the last states of an account, to report what changed.
+
+    States are compared on the decoded response, so models are only built
+    for the devices which changed.
+    """
+
+    _devices: dict[str, _Snapshot] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Return the number of devices tracked."""
+        return len(self._devices)
+
+    def update(self, device_states: list[dict[str, Any]]) -> list[DeviceState]:
+        """Replace the snapshot, return the device states which changed.
+
+        A device state is returned when it is new or its ``state`` changed,
+        or with the sensor states whose reading has a new date and value.
+        Readings with an unchanged date are skipped.
+        """
+        changes = []
+        previous = self._devices
+        current: dict[str, _Snapshot] = {}
+        for device_state in device_states:
+            device_id = device_state["deviceId"]
+            state = device_state["state"]
+            last = previous.get(device_id)
+            readings: dict[str, tuple[str, float]] = {}
+            changed_sensors = _changed_sensors(
+                device_state["sensorStates"],
+                last[1] if last is not None else {},
+                readings,
+            )
+            current[device_id] = (state, readings)
+            if last is None or last[0] != state or changed_sensors:
+                changes.append(
+                    DeviceState.from_dict(
+                        {**device_state, "sensorStates": changed_sensors}
+                    )
+                )
+        self._devices = current
+        return changes
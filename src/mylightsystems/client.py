@@ -3,27 +3,50 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+from collections import OrderedDict
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import partial
 import logging
 import socket
 from typing import TYPE_CHECKING, Any
 
-from aiohttp import ClientError, ClientResponseError, ClientSession
+from aiohttp import (
+    ClientError,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+    TCPConnector,
+)
 from aiohttp.hdrs import METH_GET
+import orjson
 from yarl import URL
 
+from mylightsystems.batch import BatchResult, gather_bounded, iter_bounded
+from mylightsystems.cache import CacheKey, request_key
+from mylightsystems.changes import StatesTracker
+from mylightsystems.columnar import StatesColumns
 from mylightsystems.const import (
     AUTH_URL,
     DEFAULT_BASE_URL,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_MAX_STATE_TRACKERS,
+    DEFAULT_STREAM_CHUNK_SIZE,
+    DEFAULT_SWITCH_CONCURRENCY,
     DEVICES_URL,
     MEASURES_TOTAL_URL,
     PROFILE_URL,
     STATES_URL,
     SWITCH_URL,
 )
-from mylightsystems.device_factory import DeviceFactory
+from mylightsystems.device_factory import default_device_factory
 from mylightsystems.exceptions import (
     MyLightSystemsConnectionError,
+    MyLightSystemsError,
     MyLightSystemsInvalidAuthError,
     MyLightSystemsMeasuresTotalNotSupportedError,
     MyLightSystemsSwitchNotAllowedError,
@@ -36,16 +59,39 @@ from mylightsystems.models import (
     DeviceState,
     Measure,
     Profile,
-    SensorMeasure,
-    SensorState,
     SwitchState,
 )
+from mylightsystems.pool import ConnectionPoolStats
+from mylightsystems.registry import DeviceRegistry
+from mylightsystems.retry import is_transient
+from mylightsystems.stream import DeviceStatesSplitter
+from mylightsystems.transport import TransportResponse
 
 if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncGenerator,
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Iterable,
+    )
+    from contextlib import AbstractContextManager
+
     from typing_extensions import Self
 
+    from mylightsystems.cache import ResponseCache
+    from mylightsystems.instrumentation import Instrumentation, RequestEvent
+    from mylightsystems.rate_limit import RateLimiter
+    from mylightsystems.retry import CircuitBreaker, RetryPolicy
+    from mylightsystems.topology import DeviceTopology, TopologyCache
+    from mylightsystems.transport import Transport
+
 _LOGGER = logging.getLogger(__name__)
 
+_HEADERS = {
+    "Content-Type": "application/json",
+}
+
 
 @dataclass
 class MyLightSystemsApiClient:
@@ -54,7 +100,66 @@ class MyLightSystemsApiClient:
     base_url: str = DEFAULT_BASE_URL
     session: ClientSession | None = None
     request_timeout: int = 10
+    json_loads: Callable[[bytes], Any] = orjson.loads
+    connection_limit: int = DEFAULT_CONNECTION_LIMIT
+    connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST
+    dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT
+    pool_stats: ConnectionPoolStats = field(default_factory=ConnectionPoolStats)
+    cache: ResponseCache | None = None
+    coalesced_requests: int = 0
+    token_refreshes: int = 0
+    retry_policies: dict[str, RetryPolicy] | None = None
+    circuit_breaker: CircuitBreaker | None = None
+    rate_limiter: RateLimiter | None = None
+    instrumentation: Instrumentation | None = None
+    transport: Transport | None = None
+    topology_cache: TopologyCache | None = None
+    max_state_trackers: int = DEFAULT_MAX_STATE_TRACKERS
     _close_session: bool = False
+    _urls: dict[str, URL] = field(default_factory=dict)
+    _inflight: dict[CacheKey, asyncio.Task[Any]] = field(default_factory=dict)
+    _credentials: tuple[str, str] | None = None
+    _auth: Auth | None = None
+    _auth_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    _trackers: OrderedDict[str | None, StatesTracker] = field(
+        default_factory=OrderedDict
+    )
+    _revalidations: dict[str, asyncio.Task[None]] = field(default_factory=dict)
+
+    def _url(self, uri: str) -> URL:
+        """Return the URL of an endpoint, built once per endpoint."""
+        url = self._urls.get(uri)
+        if url is None:
+            url = self._urls[uri] = URL(self.base_url).with_path(uri)
+        return url
+
+    def _create_session(self) -> ClientSession:
+        """Create a session with a tuned, instrumented connection pool."""
+        connector = TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        return ClientSession(
+            connector=connector,
+            trace_configs=[self.pool_stats.trace_config()],
+        )
+
+    def _instrument(
+        self, uri: str, method: str
+    ) -> AbstractContextManager[RequestEvent | None]:
+        """Measure a request, when the client is instrumented."""
+        if self.instrumentation is None:
+            return nullcontext()
+        return self.instrumentation.request(uri, method)
+
+    def _building(self, uri: str) -> AbstractContextManager[None]:
+        """Measure the build of models, when the client is instrumented."""
+        if self.instrumentation is None:
+            return nullcontext()
+        return self.instrumentation.build(uri)
 
     async def _request(
         self,
@@ -63,39 +168,143 @@ class MyLightSystemsApiClient:
         method: str = METH_GET,
         params: dict[str, Any] | None = None,
     ) -> Any:
-        """Handle a request to the MyLightSystems API."""
-        url = URL(self.base_url).with_path(uri)
+        """Handle a request to the MyLightSystems API.
 
-        headers = {
-            "Content-Type": "application/json",
-        }
+        Every attempt waits for the rate limiter. Transient errors are
+        retried following the policy of the endpoint, and counted by the
+        circuit breaker.
+        """
+        policy = self.retry_policies.get(uri) if self.retry_policies else None
+        attempt = 0
+        while True:
+            breaker = self.circuit_breaker
+            testing = breaker is not None and breaker.before_request()
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire(
+                        params.get("authToken") if params else None
+                    )
+                attempt += 1
+                response = await self._send(uri, method=method, params=params)
+            except MyLightSystemsConnectionError as exception:
+                if breaker is not None and is_transient(exception):
+                    breaker.record_failure()
+                if policy is None or not policy.should_retry(exception, attempt):
+                    raise
+                delay = policy.delay(exception, attempt)
+                _LOGGER.debug(
+                    "Retrying %s in %.2fs after attempt %s", uri, delay, attempt
+                )
+            else:
+                if breaker is not None:
+                    breaker.record_success()
+                return response
+            finally:
+                # A test request failing otherwise, or cancelled, is no verdict
+                if testing and breaker is not None:
+                    breaker.release()
+            await asyncio.sleep(delay)
+
+    async def _send(
+        self,
+        uri: str,
+        *,
+        method: str,
+        params: dict[str, Any] | None,
+    ) -> Any:
+        """Send a single request to the MyLightSystems API."""
+        url = self._url(uri)
+
+        with self._instrument(uri, method) as event:
+            try:
+                async with asyncio.timeout(self.request_timeout):
+                    response = await self._fetch(method, url, params)
+
+                    _LOGGER.debug(
+                        "Data retrieved from %s, status: %s", url, response.status
+                    )
+
+                    if event is not None:
+                        event.received(response.status, len(response.body))
+
+                    json_response = self.json_loads(response.body)
+                    if event is not None:
+                        event.decoded()
+
+                    if (
+                        json_response["status"] == "error"
+                        and json_response["error"] == "not.authorized"
+                    ):
+                        raise MyLightSystemsUnauthorizedError
+
+                    return json_response
+
+            except asyncio.TimeoutError as exception:
+                msg = "Timeout occurred while connecting to the device"
+                raise MyLightSystemsConnectionError(msg) from exception
+            except (
+                ClientError,
+                ClientResponseError,
+                socket.gaierror,
+            ) as exception:
+                msg = "Error occurred while communicating with the device"
+                raise MyLightSystemsConnectionError(msg) from exception
+            except ValueError as exception:
+                msg = "Error occurred while decoding the response"
+                raise MyLightSystemsConnectionError(msg) from exception
+
+    async def _fetch(
+        self, method: str, url: URL, params: dict[str, Any] | None
+    ) -> TransportResponse:
+        """Send a request with the transport, or else the session."""
+        if self.transport is not None:
+            return await self.transport.request(method, url, params)
 
         if self.session is None:
-            self.session = ClientSession()
+            self.session = self._create_session()
             self._close_session = True
 
-        try:
-            async with asyncio.timeout(self.request_timeout):
-                response = await self.session.request(
-                    method, url, headers=headers, params=params
-                )
+        response = await self.session.request(
+            method, url, headers=_HEADERS, params=params
+        )
+        response.raise_for_status()
+        return TransportResponse(response.status, await response.read())
 
-                _LOGGER.debug(
-                    "Data retrieved from %s, status: %s", url, response.status
-                )
+    async def _stream(
+        self, uri: str, params: dict[str, Any]
+    ) -> AsyncGenerator[bytes, None]:
+        """Stream the body of a GET request to the MyLightSystems API.
 
-                response.raise_for_status()
+        The timeout applies to each read instead of the whole request, and
+        streamed requests are neither cached, shared nor retried. A
+        transport serves the whole body at once.
+        """
+        if self.session is None and self.transport is None:
+            self.session = self._create_session()
+            self._close_session = True
 
-                json_response = await response.json()
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(params.get("authToken"))
 
-                if (
-                    json_response["status"] == "error"
-                    and json_response["error"] == "not.authorized"
+        timeout = ClientTimeout(
+            total=None,
+            sock_connect=self.request_timeout,
+            sock_read=self.request_timeout,
+        )
+        try:
+            if self.transport is not None:
+                yield (await self._fetch(METH_GET, self._url(uri), params)).body
+                return
+            assert self.session is not None  # noqa: S101
+            async with self.session.get(
+                self._url(uri), headers=_HEADERS, params=params, timeout=timeout
+            ) as response:
+                _LOGGER.debug("Streaming %s, status: %s", uri, response.status)
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(
+                    DEFAULT_STREAM_CHUNK_SIZE
                 ):
-                    raise MyLightSystemsUnauthorizedError
-
-                return json_response
-
+                    yield chunk
         except asyncio.TimeoutError as exception:
             msg = "Timeout occurred while connecting to the device"
             raise MyLightSystemsConnectionError(msg) from exception
@@ -107,6 +316,86 @@ class MyLightSystemsApiClient:
             msg = "Error occurred while communicating with the device"
             raise MyLightSystemsConnectionError(msg) from exception
 
+    async def _shared_request(self, uri: str, params: dict[str, Any]) -> Any:
+        """Handle a read-only request, sharing identical in-flight ones.
+
+        Concurrent callers of a same request await a single HTTP request and
+        its decoded response.
+        """
+        key = request_key(uri, params)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._request(uri, params=params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced_requests += 1
+        # Shielded so one cancelled caller doesn't cancel the others
+        return await asyncio.shield(task)
+
+    async def _cached_request(self, uri: str, params: dict[str, Any]) -> Any:
+        """Handle a request which may be served by the response cache."""
+        if self.cache is None:
+            return await self._shared_request(uri, params)
+
+        key = self.cache.key(uri, params)
+        response = self.cache.get(key)
+        if response is None:
+            generation = self.cache.generation
+            response = await self._shared_request(uri, params)
+            # Invalidated while in flight, the response may predate a switch
+            if self.cache.generation == generation:
+                self.cache.set(key, response, self.cache.ttl(uri, response))
+        return response
+
+    async def _refresh_auth(self, expired: Auth | None) -> Auth:
+        """Login again with the stored credentials, once for all callers.
+
+        Callers which saw the same expired auth wait on the same login and
+        then share its token.
+        """
+        async with self._auth_lock:
+            if self._auth is not None and self._auth is not expired:
+                return self._auth
+            if self._credentials is None:
+                raise MyLightSystemsUnauthorizedError
+            self._auth = await self.auth(*self._credentials)
+            self.token_refreshes += 1
+            return self._auth
+
+    async def _authenticated_request(
+        self,
+        send: Callable[..., Awaitable[Any]],
+        uri: str,
+        auth_token: str | None,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Handle a request with an explicit or a managed token.
+
+        Without an explicit token, the token of `login` is used. When it is
+        rejected the client logs in again and retries the request once.
+        """
+        if auth_token is not None:
+            return await send(uri, params={"authToken": auth_token, **(params or {})})
+
+        auth = self._auth or await self._refresh_auth(None)
+        try:
+            return await send(uri, params={"authToken": auth.token, **(params or {})})
+        except MyLightSystemsUnauthorizedError:
+            auth = await self._refresh_auth(auth)
+            return await send(uri, params={"authToken": auth.token, **(params or {})})
+
+    async def login(self, email: str, password: str) -> Auth:
+        """Login and keep the credentials to manage the token.
+
+        Methods called without an ``auth_token`` then use this token, and
+        login again when it expires.
+        """
+        auth = await self.auth(email, password)
+        self._credentials = (email, password)
+        self._auth = auth
+        return auth
+
     async def auth(self, email: str, password: str) -> Auth:
         """Login to MyLightSystems API."""
         response = await self._request(
@@ -121,37 +410,100 @@ class MyLightSystemsApiClient:
         ):
             raise MyLightSystemsInvalidAuthError
 
-        return Auth(token=response["authToken"])
+        with self._building(AUTH_URL):
+            return Auth.from_dict(response)
 
-    async def get_profile(self, auth_token: str) -> Profile:
+    async def get_profile(self, auth_token: str | None = None) -> Profile:
         """Get user profile."""
-        response = await self._request(
-            PROFILE_URL,
-            params={"authToken": auth_token},
+        response = await self._authenticated_request(
+            self._cached_request, PROFILE_URL, auth_token
         )
 
-        return Profile(id=response["id"], grid_type=response["gridType"])
+        with self._building(PROFILE_URL):
+            return Profile.from_dict(response)
 
-    async def get_devices(self, auth_token: str) -> list[Device]:
+    async def get_devices(self, auth_token: str | None = None) -> list[Device]:
         """Get devices."""
-        response = await self._request(
-            DEVICES_URL,
-            params={"authToken": auth_token},
+        response = await self._authenticated_request(
+            self._cached_request, DEVICES_URL, auth_token
         )
 
-        device_factory = DeviceFactory()
+        with self._building(DEVICES_URL):
+            return [
+                default_device_factory.create_device(data=device)
+                for device in response["devices"]
+            ]
+
+    async def get_devices_cached(
+        self, account: str, auth_token: str | None = None
+    ) -> list[Device]:
+        """Get devices from the topology cache, if the client has one.
+
+        A cached topology is returned at once, and revalidated in the
+        background when stale. ``account`` names the cache entry, as tokens
+        change when logging in again. Files are read once and written in a
+        thread, off the event loop.
+        """
+        if self.topology_cache is None:
+            return await self.get_devices(auth_token)
+
+        topology = self.topology_cache.get(account) or await asyncio.to_thread(
+            self.topology_cache.load, account
+        )
+        if topology is None:
+            devices = await self.get_devices(auth_token)
+            await asyncio.to_thread(self.topology_cache.save, account, devices)
+            return devices
 
-        return [
-            device_factory.create_device(data=device) for device in response["devices"]
-        ]
+        if self.topology_cache.is_stale(topology) and (
+            account not in self._revalidations
+        ):
+            task = asyncio.create_task(
+                self._revalidate_topology(account, auth_token, topology)
+            )
+            self._revalidations[account] = task
+            task.add_done_callback(lambda _: self._revalidations.pop(account, None))
+        return topology.devices
+
+    async def _revalidate_topology(
+        self, account: str, auth_token: str | None, topology: DeviceTopology
+    ) -> None:
+        """Fetch the devices of an account and refresh its cached topology."""
+        assert self.topology_cache is not None  # noqa: S101
+        try:
+            devices = await self.get_devices(auth_token)
+        except MyLightSystemsError as exception:
+            _LOGGER.debug("Keeping the devices of %s: %s", account, exception)
+            return
+        saved = await asyncio.to_thread(self.topology_cache.save, account, devices)
+        if saved.fingerprint != topology.fingerprint:
+            _LOGGER.debug("Devices of %s changed", account)
+
+    async def get_device_registry(
+        self,
+        auth_token: str | None = None,
+        registry: DeviceRegistry | None = None,
+    ) -> DeviceRegistry:
+        """Get devices as an indexed registry.
+
+        An existing ``registry`` is refreshed in place, only reindexing the
+        devices which changed.
+        """
+        devices = await self.get_devices(auth_token)
+        if registry is None:
+            return DeviceRegistry.from_devices(devices)
+        registry.refresh(devices)
+        return registry
 
     async def get_measures_total(
-        self, auth_token: str, device_id: str
+        self, auth_token: str | None, device_id: str
     ) -> list[Measure]:
         """Get measures total."""
-        response = await self._request(
+        response = await self._authenticated_request(
+            self._shared_request,
             MEASURES_TOTAL_URL,
-            params={"authToken": auth_token, "device_id": device_id},
+            auth_token,
+            params={"device_id": device_id},
         )
 
         if (
@@ -160,44 +512,136 @@ class MyLightSystemsApiClient:
         ):
             raise MyLightSystemsMeasuresTotalNotSupportedError
 
-        return [
-            Measure(type=measure["type"], unit=measure["unit"], value=measure["value"])
-            for measure in response["measure"]["values"]
-        ]
+        with self._building(MEASURES_TOTAL_URL):
+            return [
+                Measure.from_dict(measure) for measure in response["measure"]["values"]
+            ]
+
+    async def get_measures_total_many(
+        self,
+        auth_token: str | None,
+        device_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[BatchResult[list[Measure]]]:
+        """Get measures total of many devices, in the order of `device_ids`."""
+        return await gather_bounded(
+            partial(self.get_measures_total, auth_token), device_ids, concurrency
+        )
 
-    async def get_states(self, auth_token: str) -> list[DeviceState]:
+    def iter_measures_total(
+        self,
+        auth_token: str | None,
+        device_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[BatchResult[list[Measure]]]:
+        """Get measures total of many devices, as they complete."""
+        return iter_bounded(
+            partial(self.get_measures_total, auth_token), device_ids, concurrency
+        )
+
+    async def get_states(self, auth_token: str | None = None) -> list[DeviceState]:
         """Get states."""
-        response = await self._request(
-            STATES_URL,
-            params={"authToken": auth_token},
-        )
-
-        return [
-            DeviceState(
-                device_id=device_state["deviceId"],
-                report_period=device_state["effectiveReportPeriod"],
-                sensor_states=[
-                    SensorState(
-                        sensor_id=sensor_state["sensorId"],
-                        measure=SensorMeasure(
-                            value=sensor_state["measure"]["value"],
-                            type=sensor_state["measure"].get("type", None),
-                            unit=sensor_state["measure"].get("unit", None),
-                            date=sensor_state["measure"]["date"],
-                        ),
-                    )
-                    for sensor_state in device_state["sensorStates"]
-                ],
-                state=device_state["state"].lower() == "on",
-            )
-            for device_state in response["deviceStates"]
-        ]
+        response = await self._authenticated_request(
+            self._cached_request, STATES_URL, auth_token
+        )
+
+        with self._building(STATES_URL):
+            return [
+                DeviceState.from_dict(device_state)
+                for device_state in response["deviceStates"]
+            ]
+
+    async def get_state_changes(
+        self, auth_token: str | None = None, account: str | None = None
+    ) -> list[DeviceState]:
+        """Get the states which changed since the last call for this account.
+
+        Device states only hold their changed sensor states, and are left
+        out when neither their ``state`` nor a sensor changed. The first
+        call returns every state. ``account`` names the tracked states, so
+        they survive a new token, the token being used when it is None.
+        At most ``max_state_trackers`` accounts are tracked.
+        """
+        response = await self._authenticated_request(
+            self._cached_request, STATES_URL, auth_token
+        )
+
+        key = auth_token if account is None else account
+        tracker = self._trackers.get(key)
+        if tracker is None:
+            tracker = self._trackers[key] = StatesTracker()
+            while len(self._trackers) > self.max_state_trackers:
+                self._trackers.popitem(last=False)
+        else:
+            self._trackers.move_to_end(key)
+        with self._building(STATES_URL):
+            return tracker.update(response["deviceStates"])
+
+    async def iter_states(
+        self, auth_token: str | None = None
+    ) -> AsyncGenerator[DeviceState, None]:
+        """Get states one by one, parsing the response as it is received.
+
+        Only one device state of the response is held in memory at a time,
+        whatever the size of the installation.
+        """
+        if auth_token is not None:
+            async for device_state in self._stream_states(auth_token):
+                yield device_state
+            return
+
+        auth = self._auth or await self._refresh_auth(None)
+        try:
+            # A rejected token is reported before any state is yielded
+            async for device_state in self._stream_states(auth.token):
+                yield device_state
+        except MyLightSystemsUnauthorizedError:
+            auth = await self._refresh_auth(auth)
+            async for device_state in self._stream_states(auth.token):
+                yield device_state
+
+    async def _stream_states(self, auth_token: str) -> AsyncIterator[DeviceState]:
+        """Stream and parse the device states of a token."""
+        splitter = DeviceStatesSplitter()
+        chunks = self._stream(STATES_URL, {"authToken": auth_token})
+        try:
+            async for chunk in chunks:
+                for raw in splitter.feed(chunk):
+                    yield DeviceState.from_dict(self.json_loads(raw))
+            splitter.close()
+            if not splitter.found:
+                response = self.json_loads(splitter.head)
+                if response.get("error") == "not.authorized":
+                    raise MyLightSystemsUnauthorizedError
+                msg = "No device states in the response"
+                raise ValueError(msg)  # noqa: TRY301
+        except ValueError as exception:
+            msg = "Error occurred while decoding the response"
+            raise MyLightSystemsConnectionError(msg) from exception
+        finally:
+            await chunks.aclose()
+
+    async def get_states_columns(self, auth_token: str | None = None) -> StatesColumns:
+        """Get states as columns, without building a model per sensor."""
+        response = await self._authenticated_request(
+            self._cached_request, STATES_URL, auth_token
+        )
 
-    async def switch(self, auth_token: str, device_id: str, value: bool) -> SwitchState:  # noqa: FBT001
+        with self._building(STATES_URL):
+            return StatesColumns.from_device_states(response["deviceStates"])
+
+    async def switch(
+        self,
+        auth_token: str | None,
+        device_id: str,
+        value: bool,  # noqa: FBT001
+    ) -> SwitchState:
         """Change switch state."""
-        response = await self._request(
+        response = await self._authenticated_request(
+            self._request,
             SWITCH_URL,
-            params={"authToken": auth_token, "id": device_id, "on": str(value).lower()},
+            auth_token,
+            params={"id": device_id, "on": str(value).lower()},
         )
 
         if response["status"] == "error":
@@ -206,10 +650,43 @@ class MyLightSystemsApiClient:
             if response["error"] == "device.not.found":
                 raise MyLightSystemsUnknownDeviceError
 
-        return SwitchState(state=response["state"] == "on")
+        if self.cache is not None:
+            self.cache.invalidate_device(device_id)
+
+        with self._building(SWITCH_URL):
+            return SwitchState.from_dict(response)
+
+    async def switch_many(
+        self,
+        auth_token: str | None,
+        switches: Iterable[tuple[str, bool]],
+        concurrency: int = DEFAULT_SWITCH_CONCURRENCY,
+        timeout: float | None = None,
+    ) -> list[BatchResult[SwitchState]]:
+        """Change the state of many switches, in the order of `switches`.
+
+        Switches are sent concurrently, so a batch takes about one round
+        trip. Those still pending after `timeout` seconds are cancelled and
+        may or may not have been applied. A device listed twice raises a
+        ValueError, as the order of its switches would be undefined.
+        """
+        switches = list(switches)
+        values = dict(switches)
+        if len(values) != len(switches):
+            msg = "A device can only be switched once per batch"
+            raise ValueError(msg)
+        return await gather_bounded(
+            lambda device_id: self.switch(auth_token, device_id, values[device_id]),
+            values,
+            concurrency,
+            timeout,
+        )
 
     async def close(self) -> None:
         """Close open client session."""
+        for task in list(self._revalidations.values()):
+            task.cancel()
+        await asyncio.gather(*self._revalidations.values(), return_exceptions=True)
         if self.session and self._close_session:
             await self.session.close()
 
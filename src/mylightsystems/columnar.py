@@ -0,0 +1,124 @@
+"""Columnar view of the MyLightSystems states."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from mylightsystems.dates import parse_timestamp
+from mylightsystems.models import DeviceState, SensorMeasure, SensorState
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy as np
+
+
+def _max_length(values: Iterable[str | None]) -> int:
+    """Return the width of a fixed-size string column."""
+    return max((len(value) for value in values if value), default=1)
+
+
+@dataclass(slots=True)
+class StatesColumns:
+    """Represent states as one column per attribute.
+
+    Devices are stored once in the ``devices``, ``report_periods`` and
+    ``states`` columns. Sensor readings are stored one row per sensor in the
+    other columns, ``device_id`` giving the device each row belongs to, and
+    ``timestamp`` the reading date in seconds since the epoch.
+    """
+
+    devices: list[str] = field(default_factory=list)
+    report_periods: array[int] = field(default_factory=lambda: array("l"))
+    states: list[bool] = field(default_factory=list)
+    device_id: list[str] = field(default_factory=list)
+    sensor_id: list[str] = field(default_factory=list)
+    type: list[str | None] = field(default_factory=list)
+    unit: list[str | None] = field(default_factory=list)
+    value: array[float] = field(default_factory=lambda: array("d"))
+    timestamp: array[int] = field(default_factory=lambda: array("q"))
+
+    @classmethod
+    def from_device_states(cls, device_states: list[dict[str, Any]]) -> StatesColumns:
+        """Build the columns straight from the decoded `deviceStates` list."""
+        columns = cls()
+        for device_state in device_states:
+            device_id = device_state["deviceId"]
+            columns.devices.append(device_id)
+            columns.report_periods.append(device_state["effectiveReportPeriod"])
+            columns.states.append(device_state["state"].lower() == "on")
+            for sensor_state in device_state["sensorStates"]:
+                measure = sensor_state["measure"]
+                columns.device_id.append(device_id)
+                columns.sensor_id.append(sensor_state["sensorId"])
+                columns.type.append(measure.get("type"))
+                columns.unit.append(measure.get("unit"))
+                columns.value.append(measure["value"])
+                columns.timestamp.append(parse_timestamp(measure["date"]))
+        return columns
+
+    def __len__(self) -> int:
+        """Return the number of sensor rows."""
+        return len(self.sensor_id)
+
+    def to_numpy(self) -> np.ndarray[Any, Any]:
+        """Return the sensor rows as a NumPy structured array.
+
+        NumPy is an optional dependency, it must be installed separately.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        rows = np.empty(
+            len(self),
+            dtype=[
+                ("device_id", f"U{_max_length(self.device_id)}"),
+                ("sensor_id", f"U{_max_length(self.sensor_id)}"),
+                ("type", f"U{_max_length(self.type)}"),
+                ("unit", f"U{_max_length(self.unit)}"),
+                ("value", "f8"),
+                ("timestamp", "M8[s]"),
+            ],
+        )
+        rows["device_id"] = self.device_id
+        rows["sensor_id"] = self.sensor_id
+        rows["type"] = [value or "" for value in self.type]
+        rows["unit"] = [value or "" for value in self.unit]
+        rows["value"] = np.frombuffer(self.value, dtype="f8")
+        rows["timestamp"] = np.frombuffer(self.timestamp, dtype="i8")
+        return rows
+
+    def to_device_states(self) -> list[DeviceState]:
+        """Build the model objects on demand."""
+        dates: dict[int, datetime] = {}
+        sensor_states: dict[str, list[SensorState]] = {
+            device_id: [] for device_id in self.devices
+        }
+        for index, device_id in enumerate(self.device_id):
+            timestamp = self.timestamp[index]
+            if timestamp not in dates:
+                dates[timestamp] = datetime.fromtimestamp(timestamp, tz=UTC)
+            sensor_states[device_id].append(
+                SensorState(
+                    sensor_id=self.sensor_id[index],
+                    measure=SensorMeasure(
+                        type=self.type[index],
+                        value=self.value[index],
+                        unit=self.unit[index],
+                        date=dates[timestamp],
+                    ),
+                )
+            )
+        return [
+            DeviceState(
+                device_id=device_id,
+                report_period=report_period,
+                state=state,
+                sensor_states=sensor_states[device_id],
+            )
+            for device_id, report_period, state in zip(
+                self.devices, self.report_periods, self.states, strict=True
+            )
+        ]
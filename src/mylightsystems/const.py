@@ -1,6 +1,41 @@
 """Constants for MyLightSystems Api Client."""
 
 DEFAULT_TIMEOUT_IN_SECONDS: int = 10
+DEFAULT_CONCURRENCY: int = 4
+DEFAULT_SWITCH_CONCURRENCY: int = 32
+DEFAULT_POLLER_CONCURRENCY: int = 32
+DEFAULT_REPORT_PERIOD: int = 150
+
+# Per-token rate limiter buckets kept, least recently used ones evicted
+DEFAULT_RATE_LIMITER_MAX_TOKENS: int = 4096
+# Accounts whose states are tracked by get_state_changes, least recently
+# used ones evicted
+DEFAULT_MAX_STATE_TRACKERS: int = 4096
+
+# Connection pool of the sessions created by the client
+DEFAULT_CONNECTION_LIMIT: int = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST: int = 32
+DEFAULT_DNS_CACHE_TTL: int = 300
+DEFAULT_KEEPALIVE_TIMEOUT: float = 60
+
+# Response cache, states expire after their report period
+DEFAULT_CACHE_SIZE: int = 1024
+DEFAULT_DEVICES_CACHE_TTL: int = 3600
+DEFAULT_PROFILE_CACHE_TTL: int = 3600
+
+# Age after which a persisted device topology is revalidated
+DEFAULT_TOPOLOGY_MAX_AGE: int = 86400
+
+# Size of the chunks read from streamed responses
+DEFAULT_STREAM_CHUNK_SIZE: int = 64 * 1024
+
+# Points per chunk file of the measure store, about 27 days of readings
+# every 150 seconds
+DEFAULT_STORE_CHUNK_SIZE: int = 16384
+# Series and chunks per series kept mapped, each mapped chunk holding a
+# file descriptor
+DEFAULT_STORE_MAX_OPEN_SERIES: int = 256
+DEFAULT_STORE_MAX_OPEN_CHUNKS: int = 2
 
 DEFAULT_BASE_URL: str = "https://myhome.mylight-systems.com"
 AUTH_URL: str = "/api/auth"
@@ -0,0 +1,33 @@
+"""Date helpers for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from functools import lru_cache
+
+# Format of the dates returned by the API, which are expressed in UTC
+API_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@lru_cache(maxsize=256)
+def parse_date(value: str) -> datetime:
+    """Parse an API date to a timezone-aware datetime.
+
+    Sensors of a same response nearly always share their date, so the
+    parsed values are cached.
+    """
+    date = datetime.fromisoformat(value)
+    if date.tzinfo is None:
+        return date.replace(tzinfo=UTC)
+    return date
+
+
+@lru_cache(maxsize=256)
+def parse_timestamp(value: str) -> int:
+    """Parse an API date to seconds since the epoch."""
+    return int(parse_date(value).timestamp())
+
+
+def format_date(value: datetime) -> str:
+    """Format a datetime the way the API does."""
+    return value.astimezone(UTC).strftime(API_DATE_FORMAT)
@@ -0,0 +1,256 @@
+"""Energy aggregation for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from mylightsystems.const import DEFAULT_REPORT_PERIOD
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from typing_extensions import Self
+
+    from mylightsystems.models import DeviceState, Measure
+
+_POWER_TYPE = "electric_power"
+_ENERGY_TYPE = "energy"
+
+# Watt-hours per unit of the energy counters
+_WH_PER_UNIT = {"Ws": 1 / 3600, "Wh": 1.0, "kWh": 1000.0}
+
+
+@dataclass(slots=True)
+class Energy:
+    """Energy of positive and negative power, both in watt-hours.
+
+    For a grid sensor, positive is imported and negative is exported.
+    """
+
+    positive: float = 0.0
+    negative: float = 0.0
+
+    @property
+    def net(self) -> float:
+        """Return the positive minus the negative energy."""
+        return self.positive - self.negative
+
+    def __iadd__(self, other: Energy) -> Self:
+        """Add another energy."""
+        self.positive += other.positive
+        self.negative += other.negative
+        return self
+
+
+@dataclass
+class EnergySeries:
+    """Energy of a sensor, per time bucket of ``bucket`` seconds.
+
+    Buckets are aligned on multiples of ``bucket``. The energy of samples
+    spanning several buckets is split at their boundaries, so each bucket
+    only holds the energy of its own time span.
+    """
+
+    bucket: int = 3600
+    buckets: dict[int, Energy] = field(default_factory=dict)
+
+    def _integrate(
+        self, start: float, power: float, end: float, end_power: float
+    ) -> None:
+        """Add the energy of a linear power segment, in watts."""
+        if end <= start:
+            return
+        if power * end_power < 0:
+            # Split at the zero crossing, so both signs are accounted for
+            middle = start + power / (power - end_power) * (end - start)
+            self._integrate(start, power, middle, 0.0)
+            self._integrate(middle, 0.0, end, end_power)
+            return
+        slope = (end_power - power) / (end - start)
+        time = start
+        while time < end:
+            bucket = int(time - time % self.bucket)
+            until = min(end, bucket + self.bucket)
+            from_power = power + slope * (time - start)
+            to_power = power + slope * (until - start)
+            watt_hours = (from_power + to_power) / 2 * (until - time) / 3600
+            energy = self.buckets.get(bucket)
+            if energy is None:
+                energy = self.buckets[bucket] = Energy()
+            if watt_hours >= 0:
+                energy.positive += watt_hours
+            else:
+                energy.negative -= watt_hours
+            time = until
+
+    def total(self, start: float | None = None, end: float | None = None) -> Energy:
+        """Return the energy of the buckets starting in a time range."""
+        total = Energy()
+        for bucket, energy in self.buckets.items():
+            if (start is None or bucket >= start) and (end is None or bucket < end):
+                total += energy
+        return total
+
+    def rolling(self, window: float, now: float) -> Energy:
+        """Return the energy of the buckets of the last ``window`` seconds."""
+        return self.total(now - window, now)
+
+    def prune(self, before: float) -> None:
+        """Drop the buckets starting before a time."""
+        for bucket in [bucket for bucket in self.buckets if bucket < before]:
+            del self.buckets[bucket]
+
+
+@dataclass
+class PowerSeries(EnergySeries):
+    """Integrate instantaneous power samples, in watts.
+
+    Power is assumed linear between samples. Samples more than ``max_gap``
+    seconds apart are not integrated, as the power in between is unknown.
+    """
+
+    max_gap: float = 3 * DEFAULT_REPORT_PERIOD
+    _last: tuple[float, float] | None = None
+
+    def add(self, timestamp: float, watts: float) -> None:
+        """Add a power sample, later than the previous ones."""
+        if self._last is not None:
+            last_timestamp, last_watts = self._last
+            if timestamp <= last_timestamp:
+                return
+            if timestamp - last_timestamp <= self.max_gap:
+                self._integrate(last_timestamp, last_watts, timestamp, watts)
+        self._last = (timestamp, watts)
+
+
+@dataclass
+class CounterSeries(EnergySeries):
+    """Integrate the readings of a cumulative energy counter.
+
+    The energy between two readings is spread evenly over the time between
+    them. A counter going backwards is considered reset.
+    """
+
+    _last: tuple[float, float] | None = None
+
+    def add(self, timestamp: float, value: float, unit: str = "Ws") -> None:
+        """Add a counter reading, later than the previous ones."""
+        watt_hours = value * _WH_PER_UNIT[unit]
+        if self._last is not None:
+            last_timestamp, last_watt_hours = self._last
+            if timestamp <= last_timestamp:
+                return
+            if watt_hours >= last_watt_hours:
+                elapsed = timestamp - last_timestamp
+                watts = (watt_hours - last_watt_hours) * 3600 / elapsed
+                self._integrate(last_timestamp, watts, timestamp, watts)
+        self._last = (timestamp, watt_hours)
+
+    def add_measures(self, timestamp: float, measures: Iterable[Measure]) -> None:
+        """Add the energy counter of `get_measures_total` measures."""
+        for measure in measures:
+            if measure.type == _ENERGY_TYPE and measure.unit in _WH_PER_UNIT:
+                self.add(timestamp, measure.value, measure.unit)
+
+
+@dataclass(slots=True)
+class InstallationEnergy:
+    """Energy balance of an installation, in watt-hours."""
+
+    imported: float
+    exported: float
+    produced: float
+
+    @property
+    def self_consumed(self) -> float:
+        """Return the produced energy consumed on site."""
+        return max(self.produced - self.exported, 0.0)
+
+    @property
+    def consumed(self) -> float:
+        """Return the energy consumed on site, from the grid or produced."""
+        return self.imported + self.self_consumed
+
+
+@dataclass
+class EnergyAggregator:
+    """Aggregate the power sensors of successive states.
+
+    Every ``electric_power`` sensor gets a `PowerSeries`, updated as states
+    are added. The installation balance comes from the sensors named in
+    ``grid_sensors``, positive when importing, and ``production_sensors``,
+    whatever the sign they report production with.
+    """
+
+    bucket: int = 3600
+    max_gap: float = 3 * DEFAULT_REPORT_PERIOD
+    grid_sensors: set[str] = field(default_factory=set)
+    production_sensors: set[str] = field(default_factory=set)
+    sensors: dict[str, PowerSeries] = field(default_factory=dict)
+    _devices: dict[str, set[str]] = field(default_factory=dict)
+
+    def add_states(self, device_states: Iterable[DeviceState]) -> None:
+        """Add the power samples of device states."""
+        for device_state in device_states:
+            for sensor_state in device_state.sensor_states:
+                measure = sensor_state.measure
+                if measure.type != _POWER_TYPE:
+                    continue
+                series = self.sensors.get(sensor_state.sensor_id)
+                if series is None:
+                    series = self.sensors[sensor_state.sensor_id] = PowerSeries(
+                        self.bucket, max_gap=self.max_gap
+                    )
+                    self._devices.setdefault(device_state.device_id, set()).add(
+                        sensor_state.sensor_id
+                    )
+                series.add(measure.date.timestamp(), measure.value)
+
+    def _sum(
+        self, sensor_ids: Iterable[str], start: float | None, end: float | None
+    ) -> Energy:
+        """Return the energy of sensors in a time range."""
+        total = Energy()
+        for sensor_id in sensor_ids:
+            if (series := self.sensors.get(sensor_id)) is not None:
+                total += series.total(start, end)
+        return total
+
+    def device_total(
+        self, device_id: str, start: float | None = None, end: float | None = None
+    ) -> Energy:
+        """Return the energy of the power sensors of a device."""
+        return self._sum(self._devices.get(device_id, ()), start, end)
+
+    def device_buckets(self, device_id: str) -> dict[int, Energy]:
+        """Return the energy of a device per bucket."""
+        buckets: dict[int, Energy] = {}
+        for sensor_id in self._devices.get(device_id, ()):
+            for bucket, energy in self.sensors[sensor_id].buckets.items():
+                total = buckets.get(bucket)
+                if total is None:
+                    total = buckets[bucket] = Energy()
+                total += energy
+        return dict(sorted(buckets.items()))
+
+    def installation(
+        self, start: float | None = None, end: float | None = None
+    ) -> InstallationEnergy:
+        """Return the energy balance of the installation in a time range."""
+        grid = self._sum(self.grid_sensors, start, end)
+        production = self._sum(self.production_sensors, start, end)
+        return InstallationEnergy(
+            imported=grid.positive,
+            exported=grid.negative,
+            produced=production.positive + production.negative,
+        )
+
+    def rolling(self, window: float, now: float) -> InstallationEnergy:
+        """Return the energy balance of the last ``window`` seconds."""
+        return self.installation(now - window, now)
+
+    def prune(self, before: float) -> None:
+        """Drop the buckets starting before a time."""
+        for series in self.sensors.values():
+            series.prune(before)
@@ -27,3 +27,7 @@ class MyLightSystemsMeasuresTotalNotSupportedError(MyLightSystemsError):
 
 class MyLightSystemsSwitchNotAllowedError(MyLightSystemsError):
     """Switch not allowed error."""
+
+
+class MyLightSystemsCircuitOpenError(MyLightSystemsConnectionError):
+    """API considered down, request not sent."""
@@ -0,0 +1,200 @@
+"""Request instrumentation for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Count observed durations, in seconds, per bucket."""
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    sum: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Create a counter per bucket, and one for +Inf."""
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        """Count a duration in the first bucket holding it."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return the ``le`` labels and cumulative counts of the buckets."""
+        bounds = [*(repr(bucket) for bucket in self.buckets), "+Inf"]
+        total = 0
+        cumulative = []
+        for bound, count in zip(bounds, self.counts, strict=True):
+            total += count
+            cumulative.append((bound, total))
+        return cumulative
+
+
+@dataclass(slots=True)
+class RequestEvent:
+    """Timings of a request, as seen by the request callbacks.
+
+    ``latency`` covers the network, up to the whole body being received,
+    ``decode_time`` the JSON decoding of the body.
+    """
+
+    endpoint: str
+    method: str
+    started: float = field(default_factory=time.perf_counter)
+    status: int | None = None
+    bytes_received: int = 0
+    latency: float = 0.0
+    decode_time: float = 0.0
+    error: str | None = None
+
+    def received(self, status: int, size: int) -> None:
+        """Mark the body as received."""
+        self.status = status
+        self.bytes_received = size
+        self.latency = time.perf_counter() - self.started
+
+    def decoded(self) -> None:
+        """Mark the body as decoded."""
+        self.decode_time = time.perf_counter() - self.started - self.latency
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """Metrics of an endpoint."""
+
+    requests: int = 0
+    bytes_received: int = 0
+    errors: dict[str, int] = field(default_factory=dict)
+    latency: Histogram = field(default_factory=Histogram)
+    decode_time: Histogram = field(default_factory=Histogram)
+    build_time: Histogram = field(default_factory=Histogram)
+
+
+@dataclass
+class Instrumentation:
+    """Collect per-endpoint metrics of the requests of a client.
+
+    Callbacks of ``on_request_start`` and ``on_request_end`` get the
+    `RequestEvent` of each request, to feed a tracing system.
+    """
+
+    endpoints: dict[str, EndpointMetrics] = field(default_factory=dict)
+    on_request_start: list[Callable[[RequestEvent], None]] = field(default_factory=list)
+    on_request_end: list[Callable[[RequestEvent], None]] = field(default_factory=list)
+
+    def endpoint(self, endpoint: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint."""
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    @contextmanager
+    def request(self, endpoint: str, method: str) -> Iterator[RequestEvent]:
+        """Measure a request.
+
+        An error is counted under the class name of its cause, e.g.
+        ``ClientResponseError`` or ``TimeoutError``.
+        """
+        event = RequestEvent(endpoint, method)
+        for callback in self.on_request_start:
+            callback(event)
+        try:
+            yield event
+        except BaseException as exception:
+            event.error = type(exception.__cause__ or exception).__name__
+            raise
+        finally:
+            if not event.latency:
+                event.latency = time.perf_counter() - event.started
+            self._record(event)
+            for callback in self.on_request_end:
+                callback(event)
+
+    @contextmanager
+    def build(self, endpoint: str) -> Iterator[None]:
+        """Measure the build of the models of a response."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.endpoint(endpoint).build_time.observe(time.perf_counter() - started)
+
+    def _record(self, event: RequestEvent) -> None:
+        """Add a request to the metrics of its endpoint."""
+        metrics = self.endpoint(event.endpoint)
+        metrics.requests += 1
+        metrics.bytes_received += event.bytes_received
+        metrics.latency.observe(event.latency)
+        if event.error is not None:
+            metrics.errors[event.error] = metrics.errors.get(event.error, 0) + 1
+        elif event.status is not None:
+            metrics.decode_time.observe(event.decode_time)
+
+    def to_prometheus(self, namespace: str = "mylightsystems") -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+
+        def _header(name: str, kind: str, help_text: str) -> str:
+            lines.append(f"# HELP {namespace}_{name} {help_text}")
+            lines.append(f"# TYPE {namespace}_{name} {kind}")
+            return f"{namespace}_{name}"
+
+        name = _header("requests_total", "counter", "Requests sent.")
+        for endpoint, metrics in self.endpoints.items():
+            lines.append(f'{name}{{endpoint="{endpoint}"}} {metrics.requests}')
+
+        name = _header("request_errors_total", "counter", "Requests failed.")
+        for endpoint, metrics in self.endpoints.items():
+            for error, count in metrics.errors.items():
+                lines.append(f'{name}{{endpoint="{endpoint}",error="{error}"}} {count}')
+
+        name = _header("response_bytes_total", "counter", "Response bytes received.")
+        for endpoint, metrics in self.endpoints.items():
+            lines.append(f'{name}{{endpoint="{endpoint}"}} {metrics.bytes_received}')
+
+        for attribute, metric, help_text in (
+            ("latency", "request_duration_seconds", "Network time of requests."),
+            ("decode_time", "decode_duration_seconds", "JSON decoding time."),
+            ("build_time", "build_duration_seconds", "Model building time."),
+        ):
+            name = _header(metric, "histogram", help_text)
+            for endpoint, metrics in self.endpoints.items():
+                histogram: Histogram = getattr(metrics, attribute)
+                for bound, count in histogram.cumulative():
+                    lines.append(
+                        f'{name}_bucket{{endpoint="{endpoint}",le="{bound}"}} {count}'
+                    )
+                lines.append(f'{name}_sum{{endpoint="{endpoint}"}} {histogram.sum}')
+                lines.append(f'{name}_count{{endpoint="{endpoint}"}} {histogram.count}')
+
+        return "\n".join(lines) + "\n"
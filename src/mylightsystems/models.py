@@ -2,128 +2,195 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
 
-if TYPE_CHECKING:
-    from datetime import datetime
+from mashumaro import field_options
+from mashumaro.config import BaseConfig
+from mashumaro.mixins.orjson import DataClassORJSONMixin
 
+from mylightsystems.dates import format_date, parse_date
 
-@dataclass
-class Auth:
+
+def _deserialize_state(value: str) -> bool:
+    """Convert an API "on"/"off" state to a boolean."""
+    return value.lower() == "on"
+
+
+def _serialize_state(value: bool) -> str:  # noqa: FBT001
+    """Convert a boolean to an API "on"/"off" state."""
+    return "on" if value else "off"
+
+
+def _deserialize_children(value: list[dict[str, Any]]) -> dict[str, int]:
+    """Convert the API children list to a mac/phase mapping."""
+    return {item["mac"]: item["phase"] for item in value}
+
+
+def _serialize_children(value: dict[str, int]) -> list[dict[str, Any]]:
+    """Convert a mac/phase mapping to the API children list."""
+    return [{"mac": mac, "phase": phase} for mac, phase in value.items()]
+
+
+_STATE_OPTIONS = field_options(
+    deserialize=_deserialize_state, serialize=_serialize_state
+)
+
+
+class _Config(BaseConfig):  # pylint: disable=too-few-public-methods
+    """Serialize models with the API names, compile them on first use."""
+
+    serialize_by_alias = True
+    lazy_compilation = True
+
+
+@dataclass(slots=True)
+class Auth(DataClassORJSONMixin):
     """Auth model."""
 
-    token: str
+    token: str = field(metadata=field_options(alias="authToken"))
+
+    Config = _Config
 
 
-@dataclass
-class Profile:
+@dataclass(slots=True)
+class Profile(DataClassORJSONMixin):
     """Profile model."""
 
-    id: int
-    grid_type: str
+    id: str
+    grid_type: str = field(metadata=field_options(alias="gridType"))
+
+    Config = _Config
 
 
-@dataclass
-class Device:
+@dataclass(slots=True)
+class Device(DataClassORJSONMixin):
     """Device model."""
 
     id: str
     name: str
     type: str
-    type_id: str
+    type_id: str = field(metadata=field_options(alias="deviceTypeId"))
+
+    Config = _Config
 
 
-@dataclass
+@dataclass(slots=True)
 class BatteryDevice(Device):
     """Represent a battery."""
 
-    state: bool
-    capacity: int
+    state: bool = field(metadata=_STATE_OPTIONS)
+    capacity: int = field(metadata=field_options(alias="batteryCapacity"))
 
 
-@dataclass
+@dataclass(slots=True)
 class RelayDevice(Device):
     """Represent a relay."""
 
-    state: bool
-    master_id: str
-    master_type: str
+    state: bool = field(metadata=_STATE_OPTIONS)
+    master_id: str = field(metadata=field_options(alias="masterMac"))
+    master_type: str = field(metadata=field_options(alias="masterType"))
 
 
-@dataclass
+@dataclass(slots=True)
 class CounterDevice(Device):
     """Represent a counter."""
 
-    state: bool
+    state: bool = field(metadata=_STATE_OPTIONS)
     phase: int
-    master_id: str
-    master_type: str
+    master_id: str = field(metadata=field_options(alias="masterMac"))
+    master_type: str = field(metadata=field_options(alias="masterType"))
 
 
-@dataclass
+@dataclass(slots=True)
 class CompositeCounterDevice(Device):
     """Represent a composite counter."""
 
-    master_id: str
-    master_type: str
-    children: dict[str, int]
+    master_id: str = field(metadata=field_options(alias="masterMac"))
+    master_type: str = field(metadata=field_options(alias="masterType"))
+    children: dict[str, int] = field(
+        metadata=field_options(
+            deserialize=_deserialize_children, serialize=_serialize_children
+        )
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class VirtualDevice(Device):
     """Represent a virtual."""
 
-    state: bool
+    state: bool = field(metadata=_STATE_OPTIONS)
 
 
-@dataclass
+@dataclass(slots=True)
 class MasterDevice(Device):
     """Represent a master."""
 
-    state: bool
-    report_period: int
+    state: bool = field(metadata=_STATE_OPTIONS)
+    report_period: int = field(metadata=field_options(alias="reportPeriod"))
 
 
-@dataclass
-class Measure:
+@dataclass(slots=True)
+class Measure(DataClassORJSONMixin):
     """Represent a measure."""
 
     type: str
     value: float
     unit: str
 
+    Config = _Config
 
-@dataclass
-class SensorMeasure:
+
+@dataclass(slots=True)
+class SensorMeasure(DataClassORJSONMixin):
     """Represent a sensor measure."""
 
     type: str | None
     value: float
     unit: str | None
-    date: datetime
+    date: datetime = field(
+        metadata=field_options(deserialize=parse_date, serialize=format_date)
+    )
+
+    Config = _Config
+
+    @classmethod
+    def __pre_deserialize__(cls, d: dict[Any, Any]) -> dict[Any, Any]:
+        """Fill in the optional type and unit keys."""
+        if "type" in d and "unit" in d:
+            return d
+        return {"type": None, "unit": None, **d}
 
 
-@dataclass
-class SensorState:
+@dataclass(slots=True)
+class SensorState(DataClassORJSONMixin):
     """Represent a sensor state."""
 
-    sensor_id: str
+    sensor_id: str = field(metadata=field_options(alias="sensorId"))
     measure: SensorMeasure
 
+    Config = _Config
 
-@dataclass
-class DeviceState:
+
+@dataclass(slots=True)
+class DeviceState(DataClassORJSONMixin):
     """Represent a device state."""
 
-    device_id: str
-    report_period: int
-    state: bool
-    sensor_states: list[SensorState]
+    device_id: str = field(metadata=field_options(alias="deviceId"))
+    report_period: int = field(metadata=field_options(alias="effectiveReportPeriod"))
+    state: bool = field(metadata=_STATE_OPTIONS)
+    sensor_states: list[SensorState] = field(
+        metadata=field_options(alias="sensorStates")
+    )
+
+    Config = _Config
 
 
-@dataclass
-class SwitchState:
+@dataclass(slots=True)
+class SwitchState(DataClassORJSONMixin):
     """Represent the state of the switch."""
 
-    state: bool
+    state: bool = field(metadata=_STATE_OPTIONS)
+
+    Config = _Config
@@ -0,0 +1,219 @@
+"""Poller of the states of many MyLightSystems accounts."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import inspect
+import logging
+import random
+from typing import TYPE_CHECKING, Any
+
+from mylightsystems.const import DEFAULT_POLLER_CONCURRENCY, DEFAULT_REPORT_PERIOD
+from mylightsystems.exceptions import (
+    MyLightSystemsError,
+    MyLightSystemsUnauthorizedError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from typing_extensions import Self
+
+    from mylightsystems.client import MyLightSystemsApiClient
+    from mylightsystems.models import Auth, DeviceState
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class PollResult:
+    """Represent the outcome of polling the states of one account.
+
+    ``error`` is a `MyLightSystemsError` for API and connection errors, or
+    any other exception raised by the poll, such as a malformed response.
+    """
+
+    account: str
+    device_states: list[DeviceState] | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True when the states were retrieved."""
+        return self.error is None
+
+
+@dataclass(slots=True)
+class _Account:
+    """Polling state of one account."""
+
+    auth: Auth | None
+    report_period: float
+    credentials: tuple[str, str] | None = None
+    task: asyncio.Task[None] | None = None
+
+
+@dataclass
+class MyLightSystemsPoller:
+    """Poll `get_states` of many accounts on one client and event loop.
+
+    Each account is polled once per report period: the smallest
+    ``effectiveReportPeriod`` of its last states, or the period it was added
+    with until then. At most ``concurrency`` requests are in flight across
+    all accounts. Results are passed to ``callback`` when one is given, and
+    queued for `results` otherwise. A failed poll is delivered as an error
+    result and the account is polled again next period.
+    """
+
+    client: MyLightSystemsApiClient
+    concurrency: int = DEFAULT_POLLER_CONCURRENCY
+    callback: Callable[[PollResult], Awaitable[None] | None] | None = None
+    stagger: bool = True
+    queue: asyncio.Queue[PollResult] = field(default_factory=asyncio.Queue)
+    _accounts: dict[str, _Account] = field(default_factory=dict)
+    _semaphore: asyncio.Semaphore | None = None
+    _running: bool = False
+
+    @property
+    def accounts(self) -> list[str]:
+        """Return the polled accounts."""
+        return list(self._accounts)
+
+    def add_account(
+        self,
+        account: str,
+        auth: Auth | None,
+        report_period: float = DEFAULT_REPORT_PERIOD,
+        *,
+        credentials: tuple[str, str] | None = None,
+    ) -> None:
+        """Add, or replace, an account to poll.
+
+        The report period of the master device is a good initial period.
+        With an email and password as ``credentials``, the account logs in
+        again when its token is rejected, or first when ``auth`` is None.
+        """
+        if auth is None and credentials is None:
+            msg = "An account needs an auth or credentials"
+            raise ValueError(msg)
+        self.remove_account(account)
+        self._accounts[account] = _Account(
+            auth=auth, report_period=report_period, credentials=credentials
+        )
+        if self._running:
+            self._schedule(account)
+
+    def remove_account(self, account: str) -> None:
+        """Stop polling an account."""
+        state = self._accounts.pop(account, None)
+        if state is not None and state.task is not None:
+            state.task.cancel()
+
+    async def start(self) -> None:
+        """Start polling every account."""
+        if self._running:
+            return
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._running = True
+        for account in self._accounts:
+            self._schedule(account)
+
+    async def stop(self) -> None:
+        """Stop polling and wait for the pending polls to be cancelled."""
+        self._running = False
+        tasks = [
+            state.task for state in self._accounts.values() if state.task is not None
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for state in self._accounts.values():
+            state.task = None
+
+    async def results(self) -> AsyncIterator[PollResult]:
+        """Yield the queued results as they arrive."""
+        while True:
+            yield await self.queue.get()
+
+    def _schedule(self, account: str) -> None:
+        """Start the polling loop of an account."""
+        state = self._accounts[account]
+        state.task = asyncio.create_task(
+            self._poll_forever(account, state), name=f"mylightsystems-poll-{account}"
+        )
+
+    async def _poll_forever(self, account: str, state: _Account) -> None:
+        """Poll an account once per report period."""
+        loop = asyncio.get_running_loop()
+        if self.stagger:
+            # Spread the first polls over one period instead of a burst
+            await asyncio.sleep(random.uniform(0, state.report_period))  # noqa: S311
+
+        while True:
+            started = loop.time()
+            result = await self._poll(account, state)
+            await self._deliver(result)
+            if result.device_states:
+                state.report_period = min(
+                    device_state.report_period for device_state in result.device_states
+                )
+            await asyncio.sleep(max(0.0, started + state.report_period - loop.time()))
+
+    async def _poll(self, account: str, state: _Account) -> PollResult:
+        """Get the states of an account."""
+        assert self._semaphore is not None  # noqa: S101
+        async with self._semaphore:
+            try:
+                device_states = await self._get_states(state)
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                if not isinstance(exception, MyLightSystemsError):
+                    _LOGGER.exception("Unexpected error polling %s", account)
+                return PollResult(account=account, error=exception)
+        return PollResult(account=account, device_states=device_states)
+
+    async def _get_states(self, state: _Account) -> list[DeviceState]:
+        """Get the states of an account, logging in again when needed."""
+        if state.auth is None:
+            assert state.credentials is not None  # noqa: S101
+            state.auth = await self.client.auth(*state.credentials)
+        try:
+            return await self.client.get_states(state.auth.token)
+        except MyLightSystemsUnauthorizedError:
+            if state.credentials is None:
+                raise
+            state.auth = await self.client.auth(*state.credentials)
+            return await self.client.get_states(state.auth.token)
+
+    async def _deliver(self, result: PollResult) -> None:
+        """Hand a result to the callback, or queue it."""
+        if self.callback is None:
+            self.queue.put_nowait(result)
+            return
+        try:
+            outcome: Any = self.callback(result)
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception:  # pylint: disable=broad-exception-caught
+            _LOGGER.exception("Error in poll callback of %s", result.account)
+
+    async def __aenter__(self) -> Self:
+        """Async enter.
+
+        Returns
+        -------
+            The MyLightSystemsPoller object.
+
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Async exit.
+
+        Args:
+        ----
+            _exc_info: Exec type.
+
+        """
+        await self.stop()
@@ -0,0 +1,58 @@
+"""Connection pool statistics for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from aiohttp import TraceConfig
+
+
+@dataclass(slots=True)
+class ConnectionPoolStats:
+    """Count how the connections of a session are opened and reused."""
+
+    created: int = 0
+    reused: int = 0
+    queued: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    @property
+    def requests(self) -> int:
+        """Return the number of connections handed to requests."""
+        return self.created + self.reused
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the share of requests served by a pooled connection."""
+        return self.reused / self.requests if self.requests else 0.0
+
+    def trace_config(self) -> TraceConfig:
+        """Return a trace config feeding these statistics.
+
+        Pass it to the ``trace_configs`` of a session created outside of
+        the client to collect its statistics too.
+        """
+        trace_config = TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_create)
+        trace_config.on_connection_reuseconn.append(self._on_reuse)
+        trace_config.on_connection_queued_start.append(self._on_queued)
+        trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        return trace_config
+
+    async def _on_create(self, *_args: Any) -> None:
+        self.created += 1
+
+    async def _on_reuse(self, *_args: Any) -> None:
+        self.reused += 1
+
+    async def _on_queued(self, *_args: Any) -> None:
+        self.queued += 1
+
+    async def _on_dns_cache_hit(self, *_args: Any) -> None:
+        self.dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(self, *_args: Any) -> None:
+        self.dns_cache_misses += 1
@@ -0,0 +1,125 @@
+"""Client-side rate limiting for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from mylightsystems.const import DEFAULT_RATE_LIMITER_MAX_TOKENS
+
+
+@dataclass(slots=True)
+class RateLimiterStats:
+    """Wait-time metrics of a rate limiter."""
+
+    acquired: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Return the mean wait per request, in seconds."""
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+    def record(self, wait: float) -> None:
+        """Record the wait of one request."""
+        self.acquired += 1
+        if wait > 0:
+            self.delayed += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+
+@dataclass
+class TokenBucket:
+    """Let ``rate`` requests per second through, with bursts of ``capacity``.
+
+    Waiting callers are served in arrival order.
+    """
+
+    rate: float
+    capacity: float = 1.0
+    stats: RateLimiterStats = field(default_factory=RateLimiterStats)
+    _tokens: float | None = None
+    _updated: float = 0.0
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def _refill(self, now: float) -> float:
+        """Add the tokens earned since the last refill, return the count."""
+        if self._tokens is None:
+            self._tokens = self.capacity
+        else:
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+        return self._tokens
+
+    async def acquire(self) -> float:
+        """Wait for a token, return how long it took in seconds."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        delayed = self._lock.locked()
+        # The lock is held while sleeping, so waiters queue in FIFO order
+        async with self._lock:
+            tokens = self._refill(loop.time())
+            if tokens < 1:
+                delayed = True
+                await asyncio.sleep((1 - tokens) / self.rate)
+                tokens = self._refill(loop.time())
+            self._tokens = tokens - 1
+        wait = loop.time() - started if delayed else 0.0
+        self.stats.record(wait)
+        return wait
+
+
+@dataclass
+class RateLimiter:
+    """Rate limit requests globally and per auth token.
+
+    A request first waits for a token of its auth token bucket, then for
+    one of the global bucket, so a busy account can't starve the others of
+    global tokens while it queues. At most ``max_tokens`` auth token
+    buckets are kept, so rotated tokens don't pile up: the least recently
+    used ones, long refilled, are evicted.
+    """
+
+    rate: float | None = None
+    burst: float = 1.0
+    per_token_rate: float | None = None
+    per_token_burst: float = 1.0
+    max_tokens: int = DEFAULT_RATE_LIMITER_MAX_TOKENS
+    stats: RateLimiterStats = field(default_factory=RateLimiterStats)
+    _global: TokenBucket | None = None
+    _buckets: OrderedDict[str, TokenBucket] = field(default_factory=OrderedDict)
+
+    def __post_init__(self) -> None:
+        """Create the global bucket."""
+        if self.rate is not None:
+            self._global = TokenBucket(self.rate, self.burst)
+
+    def bucket(self, auth_token: str) -> TokenBucket | None:
+        """Return the bucket of an auth token, if they are limited."""
+        if self.per_token_rate is None:
+            return None
+        bucket = self._buckets.get(auth_token)
+        if bucket is not None:
+            self._buckets.move_to_end(auth_token)
+            return bucket
+        bucket = self._buckets[auth_token] = TokenBucket(
+            self.per_token_rate, self.per_token_burst
+        )
+        while len(self._buckets) > self.max_tokens:
+            self._buckets.popitem(last=False)
+        return bucket
+
+    async def acquire(self, auth_token: str | None = None) -> float:
+        """Wait until a request may be sent, return how long it took."""
+        wait = 0.0
+        if auth_token is not None and (bucket := self.bucket(auth_token)):
+            wait += await bucket.acquire()
+        if self._global is not None:
+            wait += await self._global.acquire()
+        self.stats.record(wait)
+        return wait
@@ -0,0 +1,145 @@
+"""Indexed device registry for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from mylightsystems.models import CompositeCounterDevice, Device, DeviceState
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Devices of an index entry, in a dict to remove them in constant time
+_Index = dict[str, dict[str, Device]]
+
+
+def _add(index: _Index, key: str | None, device: Device) -> None:
+    """Add a device under a key of an index."""
+    if key is not None:
+        index.setdefault(key, {})[device.id] = device
+
+
+def _remove(index: _Index, key: str | None, device_id: str) -> None:
+    """Remove a device from a key of an index."""
+    if key is None or (devices := index.get(key)) is None:
+        return
+    devices.pop(device_id, None)
+    if not devices:
+        del index[key]
+
+
+@dataclass(slots=True)
+class RegistryChanges:
+    """Ids of the devices changed by a refresh of a registry."""
+
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+
+@dataclass
+class DeviceRegistry:
+    """Index devices by id, type, type id and master, and join their states.
+
+    Lookups are dictionary lookups, and a refresh only reindexes the
+    devices which changed.
+    """
+
+    _devices: dict[str, Device] = field(default_factory=dict)
+    _by_type: _Index = field(default_factory=dict)
+    _by_type_id: _Index = field(default_factory=dict)
+    _by_master: _Index = field(default_factory=dict)
+    _states: dict[str, DeviceState] = field(default_factory=dict)
+
+    @classmethod
+    def from_devices(cls, devices: Iterable[Device]) -> DeviceRegistry:
+        """Build a registry of devices."""
+        registry = cls()
+        registry.refresh(devices)
+        return registry
+
+    def __len__(self) -> int:
+        """Return the number of devices."""
+        return len(self._devices)
+
+    def __iter__(self) -> Iterator[Device]:
+        """Iterate over the devices."""
+        return iter(self._devices.values())
+
+    def __contains__(self, device_id: object) -> bool:
+        """Return whether a device id is registered."""
+        return device_id in self._devices
+
+    def get(self, device_id: str) -> Device | None:
+        """Return a device by id."""
+        return self._devices.get(device_id)
+
+    def by_type(self, device_type: str) -> list[Device]:
+        """Return the devices of a type, e.g. ``sw`` for relays."""
+        return list(self._by_type.get(device_type.lower(), {}).values())
+
+    def by_type_id(self, type_id: str) -> list[Device]:
+        """Return the devices of a device type id."""
+        return list(self._by_type_id.get(type_id, {}).values())
+
+    def by_master(self, master_id: str) -> list[Device]:
+        """Return the devices attached to a master."""
+        return list(self._by_master.get(master_id, {}).values())
+
+    def children(self, device: CompositeCounterDevice) -> list[Device]:
+        """Return the registered children of a composite counter."""
+        return [
+            child
+            for child_id in device.children
+            if (child := self._devices.get(child_id)) is not None
+        ]
+
+    def state(self, device_id: str) -> DeviceState | None:
+        """Return the latest state of a device."""
+        return self._states.get(device_id)
+
+    def update_states(self, device_states: Iterable[DeviceState]) -> None:
+        """Join the latest states to the devices."""
+        for device_state in device_states:
+            self._states[device_state.device_id] = device_state
+
+    def with_states(self) -> Iterator[tuple[Device, DeviceState | None]]:
+        """Iterate over the devices and their latest state."""
+        for device_id, device in self._devices.items():
+            yield device, self._states.get(device_id)
+
+    def refresh(self, devices: Iterable[Device]) -> RegistryChanges:
+        """Replace the devices, reindexing only the changed ones."""
+        changes = RegistryChanges()
+        seen = set()
+        for device in devices:
+            seen.add(device.id)
+            current = self._devices.get(device.id)
+            if current is None:
+                changes.added.append(device.id)
+            elif current != device:
+                changes.updated.append(device.id)
+                self._remove(current)
+            else:
+                continue
+            self._add(device)
+        for device_id in [id_ for id_ in self._devices if id_ not in seen]:
+            changes.removed.append(device_id)
+            self._remove(self._devices[device_id])
+            self._states.pop(device_id, None)
+        return changes
+
+    def _add(self, device: Device) -> None:
+        """Register and index a device."""
+        self._devices[device.id] = device
+        _add(self._by_type, device.type.lower(), device)
+        _add(self._by_type_id, device.type_id, device)
+        _add(self._by_master, getattr(device, "master_id", None), device)
+
+    def _remove(self, device: Device) -> None:
+        """Unregister a device and drop it from the indexes."""
+        del self._devices[device.id]
+        _remove(self._by_type, device.type.lower(), device.id)
+        _remove(self._by_type_id, device.type_id, device.id)
+        _remove(self._by_master, getattr(device, "master_id", None), device.id)
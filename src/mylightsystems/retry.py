@@ -0,0 +1,162 @@
+"""Retry policies and circuit breaker for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import random
+import time
+from typing import TYPE_CHECKING
+
+from aiohttp import ClientError, ClientResponseError
+from aiohttp.hdrs import RETRY_AFTER
+
+from mylightsystems.const import (
+    AUTH_URL,
+    DEVICES_URL,
+    MEASURES_TOTAL_URL,
+    PROFILE_URL,
+    STATES_URL,
+    SWITCH_URL,
+)
+from mylightsystems.exceptions import MyLightSystemsCircuitOpenError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from mylightsystems.exceptions import MyLightSystemsConnectionError
+
+
+def _retry_after(exception: MyLightSystemsConnectionError) -> float | None:
+    """Return the delay the API asked for, in seconds."""
+    cause = exception.__cause__
+    if not isinstance(cause, ClientResponseError) or not cause.headers:
+        return None
+    try:
+        return max(0.0, float(cause.headers.get(RETRY_AFTER, "")))
+    except ValueError:
+        # HTTP dates are not used by the API, ignore them
+        return None
+
+
+def is_transient(exception: MyLightSystemsConnectionError) -> bool:
+    """Return True when an error may go away by itself.
+
+    Timeouts, connection failures, throttling and server errors are
+    transient. Client errors and undecodable responses are not.
+    """
+    cause = exception.__cause__
+    if isinstance(cause, ClientResponseError):
+        return cause.status == 429 or cause.status >= 500
+    # Timeouts and name resolution errors are OSError too
+    return isinstance(cause, ClientError | OSError)
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Retry transient errors with exponential backoff and jitter."""
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+    jitter: float = 1.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def should_retry(
+        self, exception: MyLightSystemsConnectionError, attempt: int
+    ) -> bool:
+        """Return True when the failed `attempt` may be retried."""
+        if attempt >= self.max_attempts or not is_transient(exception):
+            return False
+        cause = exception.__cause__
+        return (
+            not isinstance(cause, ClientResponseError)
+            or cause.status in self.retry_statuses
+        )
+
+    def delay(self, exception: MyLightSystemsConnectionError, attempt: int) -> float:
+        """Return how long to wait before the next attempt.
+
+        A ``Retry-After`` header is honoured, up to ``backoff_max``.
+        Otherwise the backoff doubles with each attempt, and up to a
+        ``jitter`` share of it is randomly removed to spread the retries.
+        """
+        retry_after = _retry_after(exception)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        backoff = min(self.backoff_max, self.backoff_base * 2.0 ** (attempt - 1))
+        return backoff * (1 - self.jitter * random.random())  # noqa: S311
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def default_retry_policies() -> dict[str, RetryPolicy]:
+    """Return the default policy of each endpoint.
+
+    Reads are retried, switching a device is not as it changes its state.
+    """
+    return {
+        AUTH_URL: RetryPolicy(),
+        PROFILE_URL: RetryPolicy(),
+        DEVICES_URL: RetryPolicy(),
+        MEASURES_TOTAL_URL: RetryPolicy(),
+        STATES_URL: RetryPolicy(),
+        SWITCH_URL: NO_RETRY,
+    }
+
+
+@dataclass
+class CircuitBreaker:
+    """Fail fast while the API keeps failing.
+
+    After ``failure_threshold`` consecutive transient failures the circuit
+    opens and requests fail immediately. Once ``recovery_timeout`` elapsed
+    the circuit is half-open: a single test request is let through while
+    the others still fail fast. Its success closes the circuit, its failure
+    opens it for another ``recovery_timeout``.
+    """
+
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    clock: Callable[[], float] = time.monotonic
+    failures: int = 0
+    opened_at: float | None = field(default=None, init=False)
+    _testing: bool = field(default=False, init=False)
+
+    @property
+    def state(self) -> str:
+        """Return the state of the circuit: closed, open or half-open."""
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at < self.recovery_timeout:
+            return "open"
+        return "half-open"
+
+    def before_request(self) -> bool:
+        """Raise when the circuit is open, or half-open and being tested.
+
+        Return whether the request is the test request, which must end with
+        `record_success`, `record_failure` or `release`.
+        """
+        state = self.state
+        if state == "open" or (state == "half-open" and self._testing):
+            raise MyLightSystemsCircuitOpenError
+        self._testing = state == "half-open"
+        return self._testing
+
+    def release(self) -> None:
+        """Let another test request through, the last one being inconclusive."""
+        self._testing = False
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self.failures = 0
+        self.opened_at = None
+        self._testing = False
+
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the circuit past the threshold."""
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = self.clock()
+            self._testing = False
@@ -0,0 +1,289 @@
+"""On-disk time series of sensor measures for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import mmap
+from pathlib import Path
+import struct
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from mylightsystems.const import (
+    DEFAULT_STORE_CHUNK_SIZE,
+    DEFAULT_STORE_MAX_OPEN_CHUNKS,
+    DEFAULT_STORE_MAX_OPEN_SERIES,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from typing_extensions import Self
+
+    from mylightsystems.models import DeviceState
+
+# Number of points written and capacity of a chunk, followed by its
+# timestamp and value columns, in native byte order
+_HEADER = struct.Struct("=qq")
+_COUNT = struct.Struct("=q")
+
+
+class _Chunk:
+    """Memory-mapped file holding a fixed number of points."""
+
+    def __init__(self, path: Path, capacity: int) -> None:
+        """Map a chunk file, creating it when missing.
+
+        The file is closed once mapped, the mapping keeps its own
+        descriptor.
+        """
+        size = _HEADER.size + 16 * capacity
+        exists = path.exists()
+        with path.open("r+b" if exists else "w+b") as file:
+            if not exists:
+                file.truncate(size)
+            self._mmap = mmap.mmap(file.fileno(), 0)
+        if not exists:
+            _HEADER.pack_into(self._mmap, 0, 0, capacity)
+        stored = _HEADER.unpack_from(self._mmap)[1]
+        if stored != capacity or len(self._mmap) != size:
+            self._mmap.close()
+            msg = f"Chunk {path} holds {stored} points, not {capacity}"
+            raise ValueError(msg)
+        view = memoryview(self._mmap)
+        columns = _HEADER.size + 8 * capacity
+        self.timestamp_column = view[_HEADER.size : columns].cast("q")
+        self.value_column = view[columns:].cast("d")
+        self.capacity = capacity
+        view.release()
+
+    @property
+    def count(self) -> int:
+        """Return the number of points written."""
+        count: int = _COUNT.unpack_from(self._mmap)[0]
+        return count
+
+    def write(self, timestamps: array[int], values: array[float]) -> None:
+        """Append points, which must fit in the chunk."""
+        count = self.count
+        end = count + len(timestamps)
+        self.timestamp_column[count:end] = timestamps
+        self.value_column[count:end] = values
+        # Count last, so an interrupted write leaves the chunk consistent
+        _COUNT.pack_into(self._mmap, 0, end)
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self.timestamp_column.release()
+        self.value_column.release()
+        self._mmap.close()
+
+
+@dataclass(slots=True)
+class Bucket:
+    """Statistics of the points of a time bucket."""
+
+    start: int
+    count: int
+    min: float
+    max: float
+    mean: float
+
+
+@dataclass
+class SensorSeries:
+    """Append-only time series of a sensor, in chunk files of a directory.
+
+    Timestamps are epoch seconds and only increase: points not newer than
+    the last one, such as a reading polled twice, are skipped. Chunks are
+    mapped on demand, at most ``max_open_chunks`` at once.
+    """
+
+    path: Path
+    chunk_size: int = DEFAULT_STORE_CHUNK_SIZE
+    max_open_chunks: int = DEFAULT_STORE_MAX_OPEN_CHUNKS
+    _paths: list[Path] = field(default_factory=list)
+    _open: OrderedDict[int, _Chunk] = field(default_factory=OrderedDict)
+
+    def __post_init__(self) -> None:
+        """List the existing chunks and map the last one."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._paths = sorted(self.path.glob("*.chunk"))
+        if self._paths:
+            self._chunk(len(self._paths) - 1)
+
+    def _chunk(self, index: int) -> _Chunk:
+        """Return a chunk, mapping it and unmapping the least recently used."""
+        chunk = self._open.get(index)
+        if chunk is not None:
+            self._open.move_to_end(index)
+            return chunk
+        chunk = self._open[index] = _Chunk(self._paths[index], self.chunk_size)
+        while len(self._open) > self.max_open_chunks:
+            self._open.popitem(last=False)[1].close()
+        return chunk
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        if not self._paths:
+            return 0
+        # Every chunk but the last one is full
+        last = len(self._paths) - 1
+        return self.chunk_size * last + self._chunk(last).count
+
+    @property
+    def last_timestamp(self) -> int | None:
+        """Return the timestamp of the last point."""
+        for index in reversed(range(len(self._paths))):
+            chunk = self._chunk(index)
+            if count := chunk.count:
+                timestamp: int = chunk.timestamp_column[count - 1]
+                return timestamp
+        return None
+
+    def append(self, points: Iterable[tuple[int, float]]) -> int:
+        """Append points in time order, return how many were written."""
+        last = self.last_timestamp
+        timestamps: array[int] = array("q")
+        values: array[float] = array("d")
+        for timestamp, value in points:
+            if last is None or timestamp > last:
+                timestamps.append(timestamp)
+                values.append(value)
+                last = timestamp
+
+        written = 0
+        while written < len(timestamps):
+            chunk = self._chunk(len(self._paths) - 1) if self._paths else None
+            if chunk is None or chunk.count == chunk.capacity:
+                self._paths.append(self.path / f"{len(self._paths):08d}.chunk")
+                chunk = self._chunk(len(self._paths) - 1)
+            end = written + chunk.capacity - chunk.count
+            chunk.write(timestamps[written:end], values[written:end])
+            written = min(end, len(timestamps))
+        return written
+
+    def range(self, start: int, end: int) -> Iterator[tuple[int, float]]:
+        """Iterate over the points from `start` included to `end` excluded."""
+        for index in range(len(self._paths)):
+            chunk = self._chunk(index)
+            count = chunk.count
+            timestamps = chunk.timestamp_column
+            if not count or timestamps[count - 1] < start:
+                continue
+            if timestamps[0] >= end:
+                return
+            first = bisect_left(timestamps, start, 0, count)
+            last = bisect_left(timestamps, end, first, count)
+            # Copied, as the chunk may be unmapped while the caller iterates
+            yield from zip(
+                timestamps[first:last].tolist(),
+                chunk.value_column[first:last].tolist(),
+            )
+
+    def downsample(self, start: int, end: int, bucket: int) -> list[Bucket]:
+        """Return the statistics of the points, per bucket of seconds.
+
+        Buckets are aligned on multiples of `bucket` and only the current
+        one is held in memory while reading the points.
+        """
+        buckets: list[Bucket] = []
+        current: Bucket | None = None
+        total = 0.0
+        for timestamp, value in self.range(start, end):
+            bucket_start = timestamp - timestamp % bucket
+            if current is None or current.start != bucket_start:
+                if current is not None:
+                    current.mean = total / current.count
+                current = Bucket(bucket_start, 0, value, value, 0.0)
+                buckets.append(current)
+                total = 0.0
+            current.count += 1
+            current.min = min(current.min, value)
+            current.max = max(current.max, value)
+            total += value
+        if current is not None:
+            current.mean = total / current.count
+        return buckets
+
+    def close(self) -> None:
+        """Unmap the chunks."""
+        for chunk in self._open.values():
+            chunk.close()
+        self._open.clear()
+
+
+@dataclass
+class MeasureStore:
+    """Store the measures of sensors, one series per sensor.
+
+    Each series is a directory of fixed-size chunk files mapped in memory,
+    holding a timestamp and a value column, so queries only read the
+    pages they need. At most ``max_open_series`` series are kept open,
+    the least recently used ones are closed.
+    """
+
+    directory: Path
+    chunk_size: int = DEFAULT_STORE_CHUNK_SIZE
+    max_open_series: int = DEFAULT_STORE_MAX_OPEN_SERIES
+    _series: OrderedDict[str, SensorSeries] = field(default_factory=OrderedDict)
+
+    def series(self, sensor_id: str) -> SensorSeries:
+        """Return the series of a sensor, opening it when closed."""
+        series = self._series.get(sensor_id)
+        if series is not None:
+            self._series.move_to_end(sensor_id)
+            return series
+        series = self._series[sensor_id] = SensorSeries(
+            Path(self.directory) / quote(sensor_id, safe=""), self.chunk_size
+        )
+        while len(self._series) > self.max_open_series:
+            self._series.popitem(last=False)[1].close()
+        return series
+
+    def append(self, sensor_id: str, points: Iterable[tuple[int, float]]) -> int:
+        """Append points to the series of a sensor."""
+        return self.series(sensor_id).append(points)
+
+    def append_states(self, device_states: Iterable[DeviceState]) -> int:
+        """Append the measures of device states, return how many were new."""
+        points: dict[str, list[tuple[int, float]]] = {}
+        for device_state in device_states:
+            for sensor_state in device_state.sensor_states:
+                measure = sensor_state.measure
+                points.setdefault(sensor_state.sensor_id, []).append(
+                    (int(measure.date.timestamp()), measure.value)
+                )
+        return sum(
+            self.append(sensor_id, sorted(sensor_points))
+            for sensor_id, sensor_points in points.items()
+        )
+
+    def range(
+        self, sensor_id: str, start: int, end: int
+    ) -> Iterator[tuple[int, float]]:
+        """Iterate over the points of a sensor between two timestamps."""
+        return self.series(sensor_id).range(start, end)
+
+    def downsample(
+        self, sensor_id: str, start: int, end: int, bucket: int
+    ) -> list[Bucket]:
+        """Return the statistics of the points of a sensor per bucket."""
+        return self.series(sensor_id).downsample(start, end, bucket)
+
+    def close(self) -> None:
+        """Unmap every series."""
+        for series in self._series.values():
+            series.close()
+        self._series.clear()
+
+    def __enter__(self) -> Self:
+        """Enter the store."""
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Close the store."""
+        self.close()
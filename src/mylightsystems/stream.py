@@ -0,0 +1,119 @@
+"""Incremental parsing of streamed responses for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_ARRAY_START = re.compile(rb'"deviceStates"\s*:\s*\[')
+_STRUCTURE = re.compile(rb'[][{}"\\]')
+
+# Bytes kept between chunks while looking for the array, enough for the key
+_OVERLAP = 64
+
+
+class DeviceStatesSplitter:
+    """Split the ``deviceStates`` array of a streamed body into its items.
+
+    Chunks of the body are fed as they are received and the raw JSON of
+    each item is returned as soon as it is complete, so only one item is
+    held in memory at a time.
+    """
+
+    def __init__(self) -> None:
+        """Wait for the start of the array."""
+        self._buffer = bytearray()
+        self._head = bytearray()
+        self._in_array = False
+        self._done = False
+        self._pos = 0
+        self._depth = 0
+        self._start = 0
+        self._in_string = False
+        self._escaped = -1
+
+    @property
+    def head(self) -> bytes:
+        """Return the body read before the array, or all of it when none."""
+        return bytes(self._head)
+
+    @property
+    def found(self) -> bool:
+        """Return whether the body has a ``deviceStates`` array."""
+        return self._in_array
+
+    def feed(self, chunk: bytes) -> Iterator[bytes]:
+        """Add a chunk of the body, yield the items it completes."""
+        if self._done:
+            return
+        if not self._in_array:
+            self._head += chunk
+            match = _ARRAY_START.search(
+                self._head, max(0, len(self._head) - len(chunk) - _OVERLAP)
+            )
+            if match is None:
+                return
+            self._in_array = True
+            self._buffer += self._head[match.end() :]
+            del self._head[match.start() :]
+        else:
+            self._buffer += chunk
+        yield from self._split()
+
+    def _split(self) -> Iterator[bytes]:
+        """Yield the complete items of the buffer, keep the remainder."""
+        buffer = self._buffer
+        for match in _STRUCTURE.finditer(buffer, self._pos):
+            pos = match.start()
+            char = buffer[pos]
+            if self._in_string:
+                if pos == self._escaped:
+                    continue
+                if char == 0x5C:  # backslash, the next byte is escaped
+                    self._escaped = pos + 1
+                elif char == 0x22:  # quote
+                    self._in_string = False
+            elif char == 0x22:
+                self._in_string = True
+            elif char in b"{[":
+                if self._depth == 0:
+                    self._start = pos
+                self._depth += 1
+            elif self._depth == 0:  # end of the array
+                self._done = True
+                break
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    yield bytes(buffer[self._start : pos + 1])
+                    self._start = pos + 1
+        self._compact()
+
+    def _compact(self) -> None:
+        """Drop the items already yielded, rebase the positions on the rest."""
+        buffer = self._buffer
+        if self._done:
+            buffer.clear()
+            return
+        consumed = self._start if self._depth else len(buffer)
+        del buffer[:consumed]
+        self._pos = len(buffer)
+        self._start -= consumed
+        self._escaped -= consumed
+        if self._depth == 0:
+            self._start = 0
+
+    def close(self) -> None:
+        """Check the whole array was read.
+
+        Raises
+        ------
+            ValueError: the body ended in the middle of the array.
+
+        """
+        if self._in_array and not self._done:
+            msg = "Truncated deviceStates array"
+            raise ValueError(msg)
@@ -0,0 +1,145 @@
+"""Synchronous facade of the MyLightSystems API Client."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from mylightsystems.batch import BatchResult, gather_bounded
+from mylightsystems.client import MyLightSystemsApiClient
+from mylightsystems.const import (
+    DEFAULT_BASE_URL,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_SWITCH_CONCURRENCY,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine, Iterable
+
+    from typing_extensions import Self
+
+    from mylightsystems.models import (
+        Auth,
+        Device,
+        DeviceState,
+        Measure,
+        Profile,
+        SwitchState,
+    )
+
+_T = TypeVar("_T")
+
+
+class MyLightSystemsSyncClient:
+    """Blocking client for sync code, such as workers and scripts.
+
+    The async client runs on an event loop owned by a background thread,
+    so every call reuses the same session and its pooled connections.
+    Methods may be called from any number of threads.
+    """
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, **kwargs: Any) -> None:
+        """Start the event loop thread.
+
+        Keyword arguments are passed to `MyLightSystemsApiClient`.
+        """
+        self.client = MyLightSystemsApiClient(base_url, **kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="mylightsystems", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, coroutine: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine on the event loop and wait for its result."""
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            msg = "Blocking call from the event loop of the client"
+            raise RuntimeError(msg)
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def login(self, email: str, password: str) -> Auth:
+        """Login and keep the credentials to manage the token."""
+        return self._run(self.client.login(email, password))
+
+    def auth(self, email: str, password: str) -> Auth:
+        """Login to MyLightSystems API."""
+        return self._run(self.client.auth(email, password))
+
+    def get_profile(self, auth_token: str | None = None) -> Profile:
+        """Get user profile."""
+        return self._run(self.client.get_profile(auth_token))
+
+    def get_devices(self, auth_token: str | None = None) -> list[Device]:
+        """Get devices."""
+        return self._run(self.client.get_devices(auth_token))
+
+    def get_states(self, auth_token: str | None = None) -> list[DeviceState]:
+        """Get states."""
+        return self._run(self.client.get_states(auth_token))
+
+    def get_measures_total(
+        self, auth_token: str | None, device_id: str
+    ) -> list[Measure]:
+        """Get measures total."""
+        return self._run(self.client.get_measures_total(auth_token, device_id))
+
+    def switch(
+        self,
+        auth_token: str | None,
+        device_id: str,
+        value: bool,  # noqa: FBT001
+    ) -> SwitchState:
+        """Change switch state."""
+        return self._run(self.client.switch(auth_token, device_id, value))
+
+    def get_states_many(
+        self,
+        auth_tokens: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[BatchResult[list[DeviceState]]]:
+        """Get states of many accounts concurrently, in the tokens order."""
+        return self._run(
+            gather_bounded(self.client.get_states, auth_tokens, concurrency)
+        )
+
+    def get_measures_total_many(
+        self,
+        auth_token: str | None,
+        device_ids: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[BatchResult[list[Measure]]]:
+        """Get measures total of many devices concurrently."""
+        return self._run(
+            self.client.get_measures_total_many(auth_token, device_ids, concurrency)
+        )
+
+    def switch_many(
+        self,
+        auth_token: str | None,
+        switches: Iterable[tuple[str, bool]],
+        concurrency: int = DEFAULT_SWITCH_CONCURRENCY,
+        timeout: float | None = None,
+    ) -> list[BatchResult[SwitchState]]:
+        """Change the state of many switches concurrently."""
+        return self._run(
+            self.client.switch_many(auth_token, switches, concurrency, timeout)
+        )
+
+    def close(self) -> None:
+        """Close the client, then stop the event loop and its thread."""
+        if self._loop.is_closed():
+            return
+        self._run(self.client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> Self:
+        """Enter the client."""
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Close the client."""
+        self.close()
@@ -0,0 +1,119 @@
+"""Persistent device topology cache for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import os
+from pathlib import Path
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import orjson
+
+from mylightsystems.const import DEFAULT_TOPOLOGY_MAX_AGE
+from mylightsystems.device_factory import DeviceFactory, default_device_factory
+from mylightsystems.exceptions import MyLightSystemsError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from mylightsystems.models import Device
+
+# Bumped when the snapshot format or the device models change
+TOPOLOGY_VERSION = 2
+
+
+def fingerprint(devices: list[Device]) -> str:
+    """Return a hash of devices, changing whenever one of them changes."""
+    payload = orjson.dumps(
+        [device.to_dict() for device in devices], option=orjson.OPT_SORT_KEYS
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+@dataclass(slots=True)
+class DeviceTopology:
+    """Snapshot of the devices of an account."""
+
+    devices: list[Device]
+    fingerprint: str
+    saved_at: float
+
+
+@dataclass
+class TopologyCache:
+    """Keep the devices of accounts in files of a directory.
+
+    Snapshots older than ``max_age`` seconds are still served, but are
+    stale and should be revalidated. Files of another `TOPOLOGY_VERSION`,
+    or which can't be read, are ignored. Snapshots loaded or saved are
+    kept in memory. The save time of a snapshot is the modification time
+    of its file, so saving unchanged devices only touches the file.
+    """
+
+    directory: Path
+    max_age: float = DEFAULT_TOPOLOGY_MAX_AGE
+    clock: Callable[[], float] = time.time
+    factory: DeviceFactory = default_device_factory
+    _topologies: dict[str, DeviceTopology] = field(default_factory=dict)
+
+    def path(self, account: str) -> Path:
+        """Return the file of an account, named after a hash of it."""
+        name = hashlib.sha256(account.encode()).hexdigest()[:32]
+        return Path(self.directory) / f"{name}.json"
+
+    def get(self, account: str) -> DeviceTopology | None:
+        """Return the snapshot of an account kept in memory."""
+        return self._topologies.get(account)
+
+    def load(self, account: str) -> DeviceTopology | None:
+        """Read the snapshot of an account, if there is a usable one."""
+        path = self.path(account)
+        try:
+            saved_at = path.stat().st_mtime
+            data = orjson.loads(path.read_bytes())
+            if data["version"] != TOPOLOGY_VERSION:
+                return None
+            topology = DeviceTopology(
+                devices=[
+                    self.factory.create_device(device) for device in data["devices"]
+                ],
+                fingerprint=data["fingerprint"],
+                saved_at=saved_at,
+            )
+        except (OSError, ValueError, LookupError, TypeError, MyLightSystemsError):
+            return None
+        self._topologies[account] = topology
+        return topology
+
+    def save(self, account: str, devices: list[Device]) -> DeviceTopology:
+        """Write the snapshot of an account, replacing the previous one.
+
+        When the devices didn't change, only the save time is updated.
+        """
+        topology = DeviceTopology(devices, fingerprint(devices), self.clock())
+        path = self.path(account)
+        previous = self._topologies.get(account)
+        if previous is None or previous.fingerprint != topology.fingerprint:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            temporary.write_bytes(
+                orjson.dumps(
+                    {
+                        "version": TOPOLOGY_VERSION,
+                        "fingerprint": topology.fingerprint,
+                        "devices": [device.to_dict() for device in devices],
+                    }
+                )
+            )
+            # Atomic, so concurrent workers never read a partial file
+            temporary.replace(path)
+        os.utime(path, (topology.saved_at, topology.saved_at))
+        self._topologies[account] = topology
+        return topology
+
+    def is_stale(self, topology: DeviceTopology) -> bool:
+        """Return whether a snapshot should be revalidated."""
+        return self.clock() - topology.saved_at >= self.max_age
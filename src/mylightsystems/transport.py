@@ -0,0 +1,234 @@
+"""Pluggable transports for MyLightSystems API Client."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from aiohttp import ClientConnectionError, ClientResponseError, RequestInfo
+from multidict import CIMultiDict, CIMultiDictProxy
+import orjson
+
+from mylightsystems.const import PROFILE_URL
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from aiohttp import ClientSession
+    from yarl import URL
+
+# Params which identify the account, never recorded nor matched on replay
+_SECRET_PARAMS = frozenset({"authToken", "email", "password"})
+
+# Response fields redacted from recordings, the personal ones on the profile
+_SECRET_FIELDS = _SECRET_PARAMS
+_PERSONAL_FIELDS = frozenset(
+    {
+        "additionalAddress",
+        "address",
+        "birthDate",
+        "city",
+        "companyName",
+        "firstName",
+        "lastName",
+        "latitude",
+        "longitude",
+        "mobileNumber",
+        "name",
+        "phoneNumber",
+        "postalCode",
+    }
+)
+_REDACTED = "redacted"
+
+# Response headers recorded, others may hold session cookies
+_RECORDED_HEADERS = ("Content-Type", "Retry-After")
+
+RequestKey = tuple[str, str, tuple[tuple[str, str], ...]]
+
+
+def request_key(method: str, path: str, params: dict[str, Any] | None) -> RequestKey:
+    """Return the key of a request, without its secret params."""
+    return (
+        method.upper(),
+        path,
+        tuple(
+            sorted(
+                (key, str(value))
+                for key, value in (params or {}).items()
+                if key not in _SECRET_PARAMS
+            )
+        ),
+    )
+
+
+@dataclass(slots=True)
+class TransportResponse:
+    """Status, raw body and headers of a response."""
+
+    status: int
+    body: bytes
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+
+class Transport(Protocol):  # pylint: disable=too-few-public-methods
+    """Send the requests of a client instead of its session.
+
+    Error statuses are raised as `aiohttp.ClientResponseError`.
+    """
+
+    async def request(
+        self, method: str, url: URL, params: dict[str, Any] | None
+    ) -> TransportResponse:
+        """Send a request and return its response."""
+
+
+def _raise_for_status(method: str, url: URL, response: TransportResponse) -> None:
+    """Raise the error of a replayed error status, as aiohttp does."""
+    if response.status >= 400:
+        raise ClientResponseError(
+            RequestInfo(url, method, CIMultiDictProxy(CIMultiDict()), url),
+            (),
+            status=response.status,
+            headers=CIMultiDictProxy(CIMultiDict(response.headers)),
+        )
+
+
+def _redact(value: Any, fields: frozenset[str]) -> Any:
+    """Return a decoded body with the string values of fields redacted."""
+    if isinstance(value, dict):
+        return {
+            key: _REDACTED
+            if key in fields and isinstance(item, str)
+            else _redact(item, fields)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact(item, fields) for item in value]
+    return value
+
+
+def _redact_body(path: str, body: bytes) -> bytes:
+    """Return a response body without its secret and personal fields."""
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return body
+    fields = _SECRET_FIELDS
+    if path == PROFILE_URL:
+        fields |= _PERSONAL_FIELDS
+    return orjson.dumps(_redact(data, fields))
+
+
+@dataclass
+class ReplayTransport:
+    """Serve responses from memory, without network.
+
+    Requests are matched on their method, path and params, except the
+    secret ones, so recordings replay whatever the account.
+    """
+
+    responses: dict[RequestKey, TransportResponse] = field(default_factory=dict)
+    latency: float = 0.0
+
+    @classmethod
+    def load(cls, path: str | Path) -> ReplayTransport:
+        """Load the responses saved by a `RecordingTransport`."""
+        transport = cls()
+        for item in orjson.loads(Path(path).read_bytes()):
+            transport.responses[
+                request_key(item["method"], item["path"], item["params"])
+            ] = TransportResponse(
+                item["status"], item["body"].encode(), item.get("headers", {})
+            )
+        return transport
+
+    def add(
+        self,
+        path: str,
+        body: bytes,
+        *,
+        method: str = "GET",
+        params: dict[str, Any] | None = None,
+        status: int = 200,
+    ) -> None:
+        """Serve a response for a request."""
+        self.add_response(
+            path, TransportResponse(status, body), method=method, params=params
+        )
+
+    def add_response(
+        self,
+        path: str,
+        response: TransportResponse,
+        *,
+        method: str = "GET",
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        """Serve a response, with its headers, for a request."""
+        self.responses[request_key(method, path, params)] = response
+
+    async def request(
+        self, method: str, url: URL, params: dict[str, Any] | None
+    ) -> TransportResponse:
+        """Return the response of a request."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        response = self.responses.get(request_key(method, url.path, params))
+        if response is None:
+            msg = f"No response for {method} {url.path}"
+            raise ClientConnectionError(msg)
+        _raise_for_status(method, url, response)
+        return response
+
+
+@dataclass
+class RecordingTransport:
+    """Send requests with a session and record their responses.
+
+    Secret params, secret fields of the bodies, such as the token of a
+    login, and personal fields of the profile are left out of the
+    recording, which `save` writes for a `ReplayTransport` to load.
+    """
+
+    session: ClientSession
+    records: list[dict[str, Any]] = field(default_factory=list)
+
+    async def request(
+        self, method: str, url: URL, params: dict[str, Any] | None
+    ) -> TransportResponse:
+        """Send a request and record its response."""
+        async with self.session.request(
+            method,
+            url,
+            headers={"Content-Type": "application/json"},
+            params=params,
+        ) as response:
+            body = await response.read()
+            recorded = TransportResponse(
+                response.status,
+                body,
+                {
+                    name: response.headers[name]
+                    for name in _RECORDED_HEADERS
+                    if name in response.headers
+                },
+            )
+        self.records.append(
+            {
+                "method": method,
+                "path": url.path,
+                "params": dict(request_key(method, url.path, params)[2]),
+                "status": recorded.status,
+                "headers": recorded.headers,
+                "body": _redact_body(url.path, body).decode(),
+            }
+        )
+        _raise_for_status(method, url, recorded)
+        return recorded
+
+    def save(self, path: str | Path) -> None:
+        """Write the recorded responses to a file."""
+        Path(path).write_bytes(orjson.dumps(self.records, option=orjson.OPT_INDENT_2))
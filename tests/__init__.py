@@ -1,9 +1,32 @@
 """Asynchronous Python client for MyLightSystems API."""
 
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aioresponses import aioresponses
 
 
 def load_fixture(filename: str) -> str:
     """Load a fixture."""
     path = Path(__package__) / "fixtures" / filename
     return path.read_text(encoding="utf-8")
+
+
+def count_requests(responses: aioresponses) -> int:
+    """Return the number of requests sent."""
+    return sum(len(calls) for calls in responses.requests.values())
+
+
+class FakeClock:
+    """Clock moved by hand."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
@@ -7,6 +7,7 @@ from aioresponses import aioresponses
 import pytest
 
 from mylightsystems import MyLightSystemsApiClient
+from tests import FakeClock
 from tests.const import MOCK_URL
 
 
@@ -25,3 +26,9 @@ def aioresponses_fixture() -> Generator[aioresponses, None, None]:
     """Return aioresponses fixture."""
     with aioresponses() as mocked_responses:
         yield mocked_responses
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Return a fake clock."""
+    return FakeClock()
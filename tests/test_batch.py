@@ -0,0 +1,71 @@
+"""Tests for bounded batches."""
+
+import asyncio
+
+import pytest
+
+from mylightsystems.batch import gather_bounded, iter_bounded
+from mylightsystems.exceptions import MyLightSystemsConnectionError, MyLightSystemsError
+
+
+async def test_gather_bounded_limit_concurrency() -> None:
+    """Test no more than `concurrency` calls run at once."""
+    running = 0
+    peak = 0
+
+    async def func(key: str) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return key.upper()
+
+    results = await gather_bounded(func, [str(i) for i in range(10)], 3)
+
+    assert peak == 3
+    assert [result.value for result in results] == [str(i) for i in range(10)]
+
+
+async def test_gather_bounded_propagate_unexpected_errors() -> None:
+    """Test errors which are not API errors are not captured."""
+
+    async def func(key: str) -> str:
+        if key == "boom":
+            raise RuntimeError
+        raise MyLightSystemsError
+
+    with pytest.raises(RuntimeError):
+        await gather_bounded(func, ["a", "boom"], 2)
+
+
+async def test_iter_bounded_cancel_pending_calls_on_close() -> None:
+    """Test leaving the iterator early cancels the remaining calls."""
+    started: list[str] = []
+
+    async def func(key: str) -> str:
+        started.append(key)
+        await asyncio.sleep(0 if key == "fast" else 10)
+        return key
+
+    iterator = iter_bounded(func, ["fast", "slow"], 2)
+    async for result in iterator:
+        assert result.key == "fast"
+        break
+    await iterator.aclose()
+
+    assert started == ["fast", "slow"]
+
+
+async def test_gather_bounded_deadline() -> None:
+    """Test calls still running at the deadline get an error."""
+
+    async def func(key: str) -> str:
+        await asyncio.sleep(0 if key == "fast" else 10)
+        return key
+
+    results = await gather_bounded(func, ["slow", "fast"], 2, timeout=0.05)
+
+    assert [result.key for result in results] == ["slow", "fast"]
+    assert isinstance(results[0].error, MyLightSystemsConnectionError)
+    assert results[1].value == "fast"
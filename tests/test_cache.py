@@ -0,0 +1,164 @@
+"""Tests for the response cache."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import aiohttp
+from aioresponses import CallbackResult, aioresponses
+import pytest
+
+from mylightsystems import MyLightSystemsApiClient
+from mylightsystems.cache import ResponseCache
+from tests import FakeClock, count_requests, load_fixture
+from tests.const import MOCK_URL
+
+_DEVICES_URL = f"{MOCK_URL}/api/devices"
+_STATES_URL = f"{MOCK_URL}/api/states"
+_SWITCH_URL = f"{MOCK_URL}/api/device/switch"
+
+
+@pytest.fixture(name="cached_client")
+async def cached_client_fixture(
+    clock: FakeClock,
+) -> AsyncGenerator[MyLightSystemsApiClient, None]:
+    """Return a client with a response cache."""
+    async with aiohttp.ClientSession() as session, MyLightSystemsApiClient(
+        MOCK_URL, session=session, cache=ResponseCache(clock=clock)
+    ) as mylightsystems_client:
+        yield mylightsystems_client
+
+
+async def test_get_states_cached_for_report_period(
+    responses: aioresponses,
+    cached_client: MyLightSystemsApiClient,
+    clock: FakeClock,
+) -> None:
+    """Test states are served from the cache until their period elapsed."""
+    responses.get(
+        f"{_STATES_URL}?authToken=fake-token",
+        status=200,
+        body=load_fixture("states.json"),
+        repeat=True,
+    )
+
+    first = await cached_client.get_states(auth_token="fake-token")
+    clock.now = 149
+    second = await cached_client.get_states(auth_token="fake-token")
+    assert first == second
+    assert first is not second
+    assert count_requests(responses) == 1
+
+    clock.now = 150
+    await cached_client.get_states(auth_token="fake-token")
+
+    assert count_requests(responses) == 2
+    assert cached_client.cache is not None
+    assert cached_client.cache.hits == 1
+    assert cached_client.cache.misses == 2
+
+
+async def test_get_devices_cached_per_token(
+    responses: aioresponses,
+    cached_client: MyLightSystemsApiClient,
+) -> None:
+    """Test each token has its own cached devices."""
+    for token in ("token-1", "token-2"):
+        responses.get(
+            f"{_DEVICES_URL}?authToken={token}",
+            status=200,
+            body=load_fixture("devices.json"),
+        )
+
+    for token in ("token-1", "token-2", "token-1", "token-2"):
+        await cached_client.get_devices(auth_token=token)
+
+    assert count_requests(responses) == 2
+
+
+async def test_switch_invalidate_states_including_device(
+    responses: aioresponses,
+    cached_client: MyLightSystemsApiClient,
+) -> None:
+    """Test switching a device drops the cached states which include it."""
+    responses.get(
+        f"{_STATES_URL}?authToken=fake-token",
+        status=200,
+        body=load_fixture("states.json"),
+        repeat=True,
+    )
+    responses.get(
+        f"{_SWITCH_URL}?authToken=fake-token&id=F7DFE301A82C&on=true",
+        status=200,
+        body=load_fixture("switch.json"),
+    )
+
+    await cached_client.get_states(auth_token="fake-token")
+    await cached_client.switch(
+        auth_token="fake-token", device_id="F7DFE301A82C", value=True
+    )
+    await cached_client.get_states(auth_token="fake-token")
+
+    assert count_requests(responses) == 3
+
+
+async def test_switch_during_states_request_skip_caching(
+    responses: aioresponses,
+    cached_client: MyLightSystemsApiClient,
+) -> None:
+    """Test states fetched before a switch completes aren't cached."""
+    gate = asyncio.Event()
+
+    async def slow_states(_url: Any, **_kwargs: Any) -> CallbackResult:
+        await gate.wait()
+        return CallbackResult(body=load_fixture("states.json"))
+
+    responses.get(f"{_STATES_URL}?authToken=fake-token", callback=slow_states)
+    responses.get(
+        f"{_STATES_URL}?authToken=fake-token",
+        status=200,
+        body=load_fixture("states.json"),
+    )
+    responses.get(
+        f"{_SWITCH_URL}?authToken=fake-token&id=F7DFE301A82C&on=true",
+        status=200,
+        body=load_fixture("switch.json"),
+    )
+
+    states = asyncio.create_task(cached_client.get_states(auth_token="fake-token"))
+    await asyncio.sleep(0)
+    await cached_client.switch(
+        auth_token="fake-token", device_id="F7DFE301A82C", value=True
+    )
+    gate.set()
+    await states
+    await cached_client.get_states(auth_token="fake-token")
+
+    assert count_requests(responses) == 3
+
+
+def test_cache_evict_least_recently_used(clock: FakeClock) -> None:
+    """Test the cache is bounded in size."""
+    cache = ResponseCache(max_size=2, clock=clock)
+    keys = [cache.key("/api/profile", {"authToken": str(i)}) for i in range(3)]
+
+    cache.set(keys[0], {"id": 0}, 10)
+    cache.set(keys[1], {"id": 1}, 10)
+    assert cache.get(keys[0]) == {"id": 0}
+    cache.set(keys[2], {"id": 2}, 10)
+
+    assert len(cache) == 2
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == {"id": 0}
+
+
+def test_cache_skip_uncacheable_responses(clock: FakeClock) -> None:
+    """Test responses without a TTL are not cached."""
+    cache = ResponseCache(clock=clock)
+    key = cache.key("/api/measures/total", {"authToken": "token"})
+
+    cache.set(key, {"status": "ok"}, cache.ttl("/api/measures/total", {}))
+
+    assert len(cache) == 0
+    assert cache.ttl("/api/states", {"deviceStates": []}) == 150
+    assert ResponseCache(states_ttl=5).ttl("/api/states", {}) == 5
@@ -0,0 +1,132 @@
+"""Tests for the client request pipeline."""
+
+import asyncio
+import json
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aioresponses import aioresponses
+import pytest
+
+from mylightsystems import (
+    MyLightSystemsApiClient,
+    MyLightSystemsConnectionError,
+    MyLightSystemsUnauthorizedError,
+)
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+_PROFILE_URL = f"{MOCK_URL}/api/profile"
+_STATES_URL = f"{MOCK_URL}/api/states"
+
+
+async def test_request_use_custom_json_loads(
+    responses: aioresponses,
+) -> None:
+    """Test the decoder hook receives the raw body."""
+    bodies: list[bytes] = []
+
+    def json_loads(body: bytes) -> Any:
+        bodies.append(body)
+        return json.loads(body)
+
+    responses.get(
+        f"{_PROFILE_URL}?authToken=fake-token",
+        status=200,
+        body=load_fixture("profile.json"),
+    )
+    async with aiohttp.ClientSession() as session:
+        client = MyLightSystemsApiClient(
+            MOCK_URL, session=session, json_loads=json_loads
+        )
+        response = await client.get_profile(auth_token="fake-token")
+
+    assert response.id == "fake_user_id"
+    assert len(bodies) == 1
+    assert isinstance(bodies[0], bytes)
+
+
+async def test_request_with_invalid_json_raise_error(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test a body that is not JSON."""
+    responses.get(
+        f"{_PROFILE_URL}?authToken=fake-token",
+        status=200,
+        body="<html></html>",
+    )
+
+    with pytest.raises(MyLightSystemsConnectionError):
+        await client.get_profile(auth_token="fake-token")
+
+
+async def test_request_reuse_pooled_connections() -> None:
+    """Test the owned session keeps connections alive and counts reuses."""
+
+    async def profile(_request: web.Request) -> web.Response:
+        return web.Response(
+            text=load_fixture("profile.json"), content_type="application/json"
+        )
+
+    app = web.Application()
+    app.router.add_get("/api/profile", profile)
+    async with TestServer(app) as server:
+        async with MyLightSystemsApiClient(str(server.make_url(""))) as client:
+            for _ in range(3):
+                await client.get_profile(auth_token="fake-token")
+
+            assert client._close_session
+            assert client.session is not None
+            connector = client.session.connector
+            assert isinstance(connector, aiohttp.TCPConnector)
+            assert connector.limit_per_host == client.connection_limit_per_host
+
+        assert client.pool_stats.created == 1
+        assert client.pool_stats.reused == 2
+        assert client.pool_stats.hit_ratio == pytest.approx(2 / 3)
+
+
+async def test_request_coalesce_identical_inflight_calls(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test concurrent identical calls share one request."""
+    responses.get(
+        f"{_STATES_URL}?authToken=fake-token",
+        status=200,
+        body=load_fixture("states.json"),
+    )
+
+    results = await asyncio.gather(
+        *(client.get_states(auth_token="fake-token") for _ in range(5))
+    )
+
+    assert all(result == results[0] for result in results)
+    assert results[0] is not results[1]
+    assert client.coalesced_requests == 4
+    assert client._inflight == {}
+
+
+async def test_request_coalesce_share_errors(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test every coalesced caller gets the error of the shared request."""
+    responses.get(
+        f"{_STATES_URL}?authToken=fake-token",
+        status=200,
+        body=load_fixture("unauthorized.json"),
+    )
+
+    results = await asyncio.gather(
+        *(client.get_states(auth_token="fake-token") for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert all(
+        isinstance(result, MyLightSystemsUnauthorizedError) for result in results
+    )
+    assert client.coalesced_requests == 2
@@ -0,0 +1,36 @@
+"""Tests for date helpers."""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+from mylightsystems.dates import format_date, parse_date, parse_timestamp
+
+
+def test_parse_date_return_utc_datetime() -> None:
+    """Test API dates are read as UTC."""
+    assert parse_date("2024-07-28 18:03:14") == datetime(
+        2024, 7, 28, 18, 3, 14, tzinfo=UTC
+    )
+    assert parse_date("2024-07-28 11:05:39Z").tzinfo == UTC
+
+
+def test_parse_date_use_cache() -> None:
+    """Test repeated dates are served from the cache."""
+    parse_date.cache_clear()
+    for _ in range(10):
+        parse_date("2024-07-28 18:03:14")
+
+    info = parse_date.cache_info()
+    assert info.misses == 1
+    assert info.hits == 9
+
+
+def test_parse_timestamp_return_epoch_seconds() -> None:
+    """Test API dates as epoch seconds."""
+    assert parse_timestamp("2024-07-28 18:03:14") == 1722189794
+
+
+def test_format_date_convert_to_utc() -> None:
+    """Test dates are formatted in UTC."""
+    date = datetime(2024, 7, 28, 20, 3, 14, tzinfo=timezone(timedelta(hours=2)))
+
+    assert format_date(date) == "2024-07-28 18:03:14"
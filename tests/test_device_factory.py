@@ -0,0 +1,41 @@
+"""Tests for the device factory."""
+
+import pytest
+
+from mylightsystems.device_factory import DeviceFactory
+from mylightsystems.exceptions import MyLightSystemsUnknownDeviceError
+from mylightsystems.models import CompositeCounterDevice, RelayDevice
+
+
+def test_get_device_class_ignore_case() -> None:
+    """Test the device class is resolved from the payload type."""
+    factory = DeviceFactory()
+
+    assert factory.get_device_class({"type": "SW"}) is RelayDevice
+
+
+def test_create_device_apply_transformers() -> None:
+    """Test values are transformed while building the device."""
+    device = DeviceFactory().create_device(
+        {
+            "id": "4D9F3081C75E",
+            "name": "Compteur",
+            "type": "GMD",
+            "deviceTypeId": "composite_device",
+            "masterMac": "F8DFE101A81C",
+            "masterType": "mst",
+            "children": [{"mac": "B2F7E9A1C75E", "phase": 1}],
+            "power": 999.25,
+        }
+    )
+
+    assert isinstance(device, CompositeCounterDevice)
+    assert device.type_id == "composite_device"
+    assert device.children == {"B2F7E9A1C75E": 1}
+    assert device.to_dict()["children"] == [{"mac": "B2F7E9A1C75E", "phase": 1}]
+
+
+def test_create_device_with_unknown_type_raise_error() -> None:
+    """Test unknown device type."""
+    with pytest.raises(MyLightSystemsUnknownDeviceError):
+        DeviceFactory().create_device({"id": "test", "type": "unknown"})
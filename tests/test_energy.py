@@ -0,0 +1,98 @@
+"""Tests for the energy aggregation."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from mylightsystems.energy import CounterSeries, EnergyAggregator, PowerSeries
+from mylightsystems.models import DeviceState, Measure
+
+
+def test_power_series_split_buckets_and_signs() -> None:
+    """Test energy is split at bucket boundaries and zero crossings."""
+    series = PowerSeries(bucket=3600, max_gap=3600)
+    series.add(0, 1000)
+    series.add(3600, 1000)
+    series.add(5400, -1000)
+    # Ignored, not newer than the last sample
+    series.add(5400, 5000)
+
+    assert series.buckets[0].positive == pytest.approx(1000)
+    assert series.buckets[3600].positive == pytest.approx(125)
+    assert series.buckets[3600].negative == pytest.approx(125)
+    assert series.total().net == pytest.approx(1000)
+    assert series.rolling(3600, 7200).positive == pytest.approx(125)
+
+    series.prune(3600)
+    assert list(series.buckets) == [3600]
+
+
+def test_power_series_skip_gaps() -> None:
+    """Test samples too far apart are not integrated."""
+    series = PowerSeries(max_gap=600)
+    series.add(0, 1000)
+    series.add(3600, 1000)
+    series.add(3900, 1000)
+
+    assert series.total().positive == pytest.approx(1000 * 300 / 3600)
+
+
+def test_counter_series() -> None:
+    """Test counter readings are spread over time, and resets skipped."""
+    series = CounterSeries(bucket=3600)
+    series.add_measures(
+        0, [Measure(type="energy", value=0.0, unit="Ws"), Measure("power", 1, "W")]
+    )
+    series.add(7200, 7200 * 3600.0)
+    series.add(9000, 0.0)
+
+    assert series.buckets[0].positive == pytest.approx(3600)
+    assert series.buckets[3600].positive == pytest.approx(3600)
+    assert 7200 not in series.buckets
+
+
+def _device_state(minutes: int, grid: float, produced: float) -> DeviceState:
+    """Build the state of a device with a grid and a production sensor."""
+    sensor_states = [
+        {
+            "sensorId": sensor_id,
+            "measure": {
+                "value": value,
+                "type": "electric_power",
+                "unit": "watt",
+                "date": f"2024-07-28 00:{minutes:02d}:00",
+            },
+        }
+        for sensor_id, value in (("grid", grid), ("production", produced))
+    ]
+    return DeviceState.from_dict(
+        {
+            "deviceId": "device",
+            "effectiveReportPeriod": 120,
+            "state": "on",
+            "sensorStates": sensor_states,
+        }
+    )
+
+
+def test_aggregator_installation_balance() -> None:
+    """Test the installation balance from grid and production sensors."""
+    start = datetime(2024, 7, 28, tzinfo=UTC).timestamp()
+    aggregator = EnergyAggregator(
+        grid_sensors={"grid"}, production_sensors={"production"}
+    )
+
+    aggregator.add_states([_device_state(0, 500, 0)])
+    aggregator.add_states([_device_state(2, -1000, 2000)])
+
+    balance = aggregator.installation()
+    crossing = 120 * 500 / 1500
+    assert balance.imported == pytest.approx(500 / 2 * crossing / 3600)
+    assert balance.exported == pytest.approx(1000 / 2 * (120 - crossing) / 3600)
+    assert balance.produced == pytest.approx(2000 / 2 * 120 / 3600)
+    assert balance.self_consumed == pytest.approx(balance.produced - balance.exported)
+    assert balance.consumed == pytest.approx(balance.imported + balance.self_consumed)
+    assert aggregator.rolling(3600, start + 3600) == balance
+    device_total = aggregator.device_total("device")
+    assert device_total.positive == pytest.approx(balance.imported + balance.produced)
+    assert list(aggregator.device_buckets("device")) == [int(start)]
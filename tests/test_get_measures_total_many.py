@@ -0,0 +1,63 @@
+"""Tests for get measures total of many devices."""
+
+from aioresponses import aioresponses
+
+from mylightsystems import MyLightSystemsApiClient
+from mylightsystems.exceptions import MyLightSystemsMeasuresTotalNotSupportedError
+from mylightsystems.models import Measure
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+_MEASURES_TOTAL_URL = f"{MOCK_URL}/api/measures/total"
+
+
+def _mock_measures_total(responses: aioresponses) -> None:
+    """Mock a supported device `a` and an unsupported device `b`."""
+    responses.get(
+        f"{_MEASURES_TOTAL_URL}?authToken=fake-token&device_id=a",
+        status=200,
+        body=load_fixture("measures_total.json"),
+    )
+    responses.get(
+        f"{_MEASURES_TOTAL_URL}?authToken=fake-token&device_id=b",
+        status=200,
+        body=load_fixture("measures_total_unsupported.json"),
+    )
+
+
+async def test_get_measures_total_many_capture_errors_per_device(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test one unsupported device doesn't abort the batch."""
+    _mock_measures_total(responses)
+
+    results = await client.get_measures_total_many(
+        auth_token="fake-token", device_ids=["b", "a"], concurrency=2
+    )
+
+    assert [result.key for result in results] == ["b", "a"]
+    assert not results[0].ok
+    assert isinstance(results[0].error, MyLightSystemsMeasuresTotalNotSupportedError)
+    assert results[1].ok
+    assert results[1].value is not None
+    assert isinstance(results[1].value[0], Measure)
+
+
+async def test_iter_measures_total_yield_every_device(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test results are streamed as they complete."""
+    _mock_measures_total(responses)
+
+    results = {
+        result.key: result
+        async for result in client.iter_measures_total(
+            auth_token="fake-token", device_ids=["a", "b"]
+        )
+    }
+
+    assert set(results) == {"a", "b"}
+    assert results["a"].ok
+    assert not results["b"].ok
@@ -0,0 +1,76 @@
+"""Tests for get state changes."""
+
+from aioresponses import aioresponses
+import orjson
+
+from mylightsystems import MyLightSystemsApiClient
+from mylightsystems.changes import StatesTracker
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+_STATES_URL = f"{MOCK_URL}/api/states"
+
+
+def test_tracker_report_changes_only() -> None:
+    """Test only new readings and state changes are reported."""
+    device_states = orjson.loads(load_fixture("states.json"))["deviceStates"]
+    tracker = StatesTracker()
+
+    assert len(tracker.update(device_states)) == len(device_states) == len(tracker)
+    assert tracker.update(device_states) == []
+
+    first, second, third = device_states[:3]
+    # A new value with the same date is the same reading
+    first["sensorStates"][0]["measure"]["value"] = 42.0
+    # A new date with the same value is not a change
+    second["sensorStates"][0]["measure"]["date"] = "2024-07-28 18:05:44"
+    third["state"] = "on" if third["state"] == "off" else "off"
+    assert [change.device_id for change in tracker.update(device_states)] == [
+        third["deviceId"]
+    ]
+
+    first["sensorStates"][0]["measure"]["date"] = "2024-07-28 18:05:44"
+    changes = tracker.update(device_states)
+    assert len(changes) == 1
+    assert changes[0].device_id == first["deviceId"]
+    assert [sensor.measure.value for sensor in changes[0].sensor_states] == [42.0]
+
+    assert [change.device_id for change in tracker.update(device_states[1:])] == []
+    assert len(tracker.update(device_states)) == 1
+
+
+async def test_get_state_changes_per_token(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test each token has its own snapshot."""
+    for token in ("token-1", "token-1", "token-2"):
+        responses.get(
+            f"{_STATES_URL}?authToken={token}",
+            status=200,
+            body=load_fixture("states.json"),
+        )
+
+    assert len(await client.get_state_changes(auth_token="token-1")) == 8
+    assert await client.get_state_changes(auth_token="token-1") == []
+    assert len(await client.get_state_changes(auth_token="token-2")) == 8
+
+
+async def test_get_state_changes_per_account(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test an account keeps its snapshot across tokens, within the bound."""
+    for token in ("token-1", "token-2", "token-3", "token-4"):
+        responses.get(
+            f"{_STATES_URL}?authToken={token}",
+            status=200,
+            body=load_fixture("states.json"),
+        )
+    client.max_state_trackers = 1
+
+    assert len(await client.get_state_changes("token-1", account="account")) == 8
+    assert await client.get_state_changes("token-2", account="account") == []
+    assert len(await client.get_state_changes("token-3", account="other")) == 8
+    assert len(await client.get_state_changes("token-4", account="account")) == 8
+    assert list(client._trackers) == ["account"]
@@ -1,5 +1,7 @@
 """Tests for get profile."""
 
+from datetime import UTC, datetime
+
 from aioresponses import aioresponses
 import pytest
 
@@ -71,7 +73,7 @@ async def test_get_states_success_return_measures(
     sensor_state = device_state.sensor_states[0]
     assert isinstance(sensor_state, SensorState)
     assert sensor_state.sensor_id == "F7DFE301A82C-pow"
-    assert sensor_state.measure.date == "2024-07-28 18:03:14"
+    assert sensor_state.measure.date == datetime(2024, 7, 28, 18, 3, 14, tzinfo=UTC)
     assert sensor_state.measure.unit == "watt"
     assert sensor_state.measure.type == "electric_power"
     assert sensor_state.measure.value == 0.0
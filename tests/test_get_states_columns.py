@@ -0,0 +1,96 @@
+"""Tests for get states columns."""
+
+from aioresponses import aioresponses
+import pytest
+
+from mylightsystems import MyLightSystemsApiClient, MyLightSystemsUnauthorizedError
+from mylightsystems.columnar import StatesColumns
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+_STATES_URL = f"{MOCK_URL}/api/states"
+
+
+async def test_get_states_columns_with_bad_token_raise_error(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test bad token call."""
+    responses.get(
+        f"{_STATES_URL}?authToken=fake-token",
+        status=200,
+        body=load_fixture("unauthorized.json"),
+    )
+
+    with pytest.raises(MyLightSystemsUnauthorizedError):
+        await client.get_states_columns(auth_token="fake-token")
+
+
+async def test_get_states_columns_success_return_columns(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test get states columns call."""
+    responses.get(
+        f"{_STATES_URL}?authToken=fake-token",
+        status=200,
+        body=load_fixture("states.json"),
+    )
+    columns = await client.get_states_columns(auth_token="fake-token")
+    assert isinstance(columns, StatesColumns)
+    assert len(columns.devices) == 8
+    assert columns.report_periods[0] == 150
+    assert not columns.states[0]
+
+    assert len(columns) == len(columns.value)
+    assert columns.device_id[0] == "F7DFE301A82C"
+    assert columns.sensor_id[0] == "F7DFE301A82C-pow"
+    assert columns.type[0] == "electric_power"
+    assert columns.unit[0] == "watt"
+    assert columns.value[0] == 0.0
+    assert columns.timestamp[0] == 1722189794
+
+
+async def test_get_states_columns_to_device_states_match_get_states(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test the columns can be turned back into models."""
+    for _ in range(2):
+        responses.get(
+            f"{_STATES_URL}?authToken=fake-token",
+            status=200,
+            body=load_fixture("states.json"),
+        )
+    columns = await client.get_states_columns(auth_token="fake-token")
+    device_states = await client.get_states(auth_token="fake-token")
+
+    assert columns.to_device_states() == device_states
+
+
+def test_states_columns_to_numpy() -> None:
+    """Test the NumPy structured array view."""
+    pytest.importorskip("numpy")
+    columns = StatesColumns.from_device_states(
+        [
+            {
+                "deviceId": "F7DFE301A82C",
+                "effectiveReportPeriod": 150,
+                "state": "on",
+                "sensorStates": [
+                    {
+                        "sensorId": "F7DFE301A82C-pow",
+                        "measure": {"value": 12.5, "date": "2024-07-28 18:03:14"},
+                    }
+                ],
+            }
+        ]
+    )
+
+    rows = columns.to_numpy()
+
+    assert rows.shape == (1,)
+    assert rows["device_id"][0] == "F7DFE301A82C"
+    assert rows["type"][0] == ""
+    assert rows["value"][0] == 12.5
+    assert str(rows["timestamp"][0]) == "2024-07-28T18:03:14"
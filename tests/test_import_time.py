@@ -0,0 +1,60 @@
+"""Tests for the import time of the package."""
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+import mylightsystems
+
+# Cumulative import time of the package and of its models, in microseconds,
+# with a wide margin over the ~10ms and ~50ms they take so slow CI runners
+# stay under it
+IMPORT_TIME_BUDGET = 100_000
+
+_SRC = str(Path(mylightsystems.__file__).parent.parent)
+
+
+def _run(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    """Run Python code in a fresh interpreter."""
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": _SRC},
+        text=True,
+    )
+
+
+@pytest.mark.parametrize("module", ["mylightsystems", "mylightsystems.models"])
+def test_import_time_budget(module: str) -> None:
+    """Test importing the package or its models stays under the budget."""
+    stderr = _run(f"import {module}", "-X", "importtime").stderr
+    # The package is imported first, on a line of its own
+    cumulative = sum(
+        int(line.split("|")[1])
+        for line in stderr.splitlines()
+        if line.split("|")[-1].strip() in {"mylightsystems", module}
+    )
+
+    assert cumulative < IMPORT_TIME_BUDGET
+
+
+def test_heavy_dependencies_imported_lazily() -> None:
+    """Test the client and models are only imported when accessed."""
+    stdout = _run(
+        "import sys, mylightsystems\n"
+        "print('aiohttp' in sys.modules, 'mashumaro' in sys.modules)\n"
+        "mylightsystems.MyLightSystemsApiClient\n"
+        "print('aiohttp' in sys.modules)"
+    ).stdout
+
+    assert stdout.split() == ["False", "False", "True"]
+
+
+def test_unknown_attribute_raise_error() -> None:
+    """Test unknown attributes still raise an AttributeError."""
+    assert "Auth" in dir(mylightsystems)
+    assert not hasattr(mylightsystems, "Unknown")
@@ -0,0 +1,59 @@
+"""Tests for the request instrumentation."""
+
+import aiohttp
+from aioresponses import aioresponses
+import pytest
+
+from mylightsystems import MyLightSystemsApiClient, MyLightSystemsConnectionError
+from mylightsystems.instrumentation import Histogram, Instrumentation, RequestEvent
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+
+def test_histogram_buckets() -> None:
+    """Test durations are counted in cumulative buckets."""
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [("0.1", 2), ("1.0", 3), ("+Inf", 4)]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(2.65)
+
+
+async def test_instrumented_requests(responses: aioresponses) -> None:
+    """Test requests are measured per endpoint."""
+    body = load_fixture("states.json")
+    responses.get(f"{MOCK_URL}/api/states?authToken=fake-token", status=200, body=body)
+    responses.get(f"{MOCK_URL}/api/states?authToken=fake-token", status=500)
+    instrumentation = Instrumentation()
+    events: list[RequestEvent] = []
+    instrumentation.on_request_end.append(events.append)
+
+    async with aiohttp.ClientSession() as session, MyLightSystemsApiClient(
+        MOCK_URL, session=session, instrumentation=instrumentation
+    ) as client:
+        await client.get_states(auth_token="fake-token")
+        with pytest.raises(MyLightSystemsConnectionError):
+            await client.get_states(auth_token="fake-token")
+
+    metrics = instrumentation.endpoints["/api/states"]
+    assert metrics.requests == 2
+    assert metrics.bytes_received == len(body.encode())
+    assert metrics.errors == {"ClientResponseError": 1}
+    assert metrics.latency.count == 2
+    assert metrics.decode_time.count == 1
+    assert metrics.build_time.count == 1
+    assert [event.status for event in events] == [200, None]
+    assert events[0].decode_time > 0
+
+    exported = instrumentation.to_prometheus()
+    assert 'mylightsystems_requests_total{endpoint="/api/states"} 2' in exported
+    assert (
+        'mylightsystems_request_errors_total{endpoint="/api/states",'
+        'error="ClientResponseError"} 1'
+    ) in exported
+    assert (
+        'mylightsystems_request_duration_seconds_count{endpoint="/api/states"} 2'
+    ) in exported
+    assert "# TYPE mylightsystems_build_duration_seconds histogram" in exported
@@ -0,0 +1,111 @@
+"""Tests for streaming states."""
+
+from aioresponses import aioresponses
+import orjson
+import pytest
+
+from mylightsystems import (
+    MyLightSystemsApiClient,
+    MyLightSystemsConnectionError,
+    MyLightSystemsUnauthorizedError,
+)
+from mylightsystems.stream import DeviceStatesSplitter
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+_STATES_URL = f"{MOCK_URL}/api/states"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 100_000])
+def test_splitter_yield_items_across_chunks(chunk_size: int) -> None:
+    """Test items are split whatever the chunk boundaries."""
+    payload = orjson.loads(load_fixture("states.json"))
+    payload["deviceStates"][0]["deviceId"] = 'odd \\"}{][ id'
+    body = orjson.dumps(payload)
+    splitter = DeviceStatesSplitter()
+
+    items = [
+        orjson.loads(raw)
+        for start in range(0, len(body), chunk_size)
+        for raw in splitter.feed(body[start : start + chunk_size])
+    ]
+    splitter.close()
+
+    assert splitter.found
+    assert items == payload["deviceStates"]
+
+
+async def test_iter_states_yield_device_states(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test states are streamed one by one."""
+    responses.get(
+        f"{_STATES_URL}?authToken=fake-token",
+        status=200,
+        body=load_fixture("states.json"),
+    )
+
+    streamed = [state async for state in client.iter_states(auth_token="fake-token")]
+
+    responses.get(
+        f"{_STATES_URL}?authToken=fake-token",
+        status=200,
+        body=load_fixture("states.json"),
+    )
+    assert streamed == await client.get_states(auth_token="fake-token")
+
+
+async def test_iter_states_with_bad_token_raise_error(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test a rejected token raises an error."""
+    responses.get(
+        f"{_STATES_URL}?authToken=fake-token",
+        status=200,
+        body=load_fixture("unauthorized.json"),
+    )
+
+    with pytest.raises(MyLightSystemsUnauthorizedError):
+        [state async for state in client.iter_states(auth_token="fake-token")]
+
+
+async def test_iter_states_refresh_managed_token(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test an expired managed token is refreshed before streaming again."""
+    email = "fake_email@fake.com"
+    password = "fake_password"
+    for _ in range(2):
+        responses.get(
+            f"{MOCK_URL}/api/auth?email={email}&password={password}",
+            status=200,
+            body=load_fixture("login_success.json"),
+        )
+    url = f"{_STATES_URL}?authToken=fake_auth_token"
+    responses.get(url, status=200, body=load_fixture("unauthorized.json"))
+    responses.get(url, status=200, body=load_fixture("states.json"))
+
+    await client.login(email=email, password=password)
+    streamed = [state async for state in client.iter_states()]
+
+    assert len(streamed) == 8
+    assert client.token_refreshes == 1
+
+
+async def test_iter_states_truncated_body_raise_error(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test a body ending in the middle of the states raises an error."""
+    body = load_fixture("states.json")
+    responses.get(
+        f"{_STATES_URL}?authToken=fake-token",
+        status=200,
+        body=body[: len(body) // 2],
+    )
+
+    with pytest.raises(MyLightSystemsConnectionError):
+        [state async for state in client.iter_states(auth_token="fake-token")]
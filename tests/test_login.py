@@ -1,5 +1,7 @@
 """Tests for the login."""
 
+import asyncio
+
 from aioresponses import aioresponses
 import pytest
 
@@ -7,11 +9,14 @@ from mylightsystems import (
     MyLightSystemsApiClient,
     MyLightSystemsError,
     MyLightSystemsInvalidAuthError,
+    MyLightSystemsUnauthorizedError,
 )
 from tests import load_fixture
 from tests.const import MOCK_URL
 
-_AUTH_URL = f"{MOCK_URL}/api/auth"
+_AUTH = "/api/auth"
+_AUTH_URL = f"{MOCK_URL}{_AUTH}"
+_MEASURES_TOTAL_URL = f"{MOCK_URL}/api/measures/total"
 
 
 @pytest.mark.parametrize(
@@ -66,3 +71,43 @@ async def test_login_success_return_token(
     response = await client.auth(email=email, password=password)
     assert response is not None
     assert response.token == "fake_auth_token"
+
+
+async def test_login_manage_token_and_refresh_it_once(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test an expired managed token is refreshed once for all callers."""
+    email = "fake_email@fake.com"
+    password = "fake_password"
+    for _ in range(2):
+        responses.get(
+            f"{_AUTH_URL}?email={email}&password={password}",
+            status=200,
+            body=load_fixture("login_success.json"),
+        )
+    for device_id in ("a", "b", "c"):
+        url = f"{_MEASURES_TOTAL_URL}?authToken=fake_auth_token&device_id={device_id}"
+        responses.get(url, status=200, body=load_fixture("unauthorized.json"))
+        responses.get(url, status=200, body=load_fixture("measures_total.json"))
+
+    auth = await client.login(email=email, password=password)
+    results = await asyncio.gather(
+        *(client.get_measures_total(None, device_id) for device_id in "abc")
+    )
+
+    assert auth.token == "fake_auth_token"
+    assert all(len(measures) == 2 for measures in results)
+    assert client.token_refreshes == 1
+    auth_calls = [
+        calls for (_, url), calls in responses.requests.items() if url.path == _AUTH
+    ]
+    assert sum(len(calls) for calls in auth_calls) == 2
+
+
+async def test_managed_token_without_login_raise_error(
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test a missing token without credentials to login."""
+    with pytest.raises(MyLightSystemsUnauthorizedError):
+        await client.get_states()
@@ -0,0 +1,136 @@
+"""Tests for models."""
+
+import dataclasses
+from datetime import UTC, datetime
+import tracemalloc
+
+import orjson
+import pytest
+
+from mylightsystems import models
+from mylightsystems.models import (
+    Auth,
+    DeviceState,
+    MasterDevice,
+    Profile,
+    SensorMeasure,
+)
+from tests import load_fixture
+
+# Bytes a DeviceState with 3 sensors may hold, regardless of its payload
+_DEVICE_STATE_MEMORY_BUDGET = 640
+
+
+def test_device_state_from_json_use_api_names() -> None:
+    """Test states are read from their camelCase JSON keys."""
+    device_state = DeviceState.from_json(
+        """{
+            "deviceId": "F7DFE301A82C",
+            "effectiveReportPeriod": 150,
+            "state": "ON",
+            "sensorStates": [
+                {
+                    "sensorId": "F7DFE301A82C-pow",
+                    "measure": {"value": 12.5, "date": "2024-07-28 18:03:14"}
+                }
+            ]
+        }"""
+    )
+
+    assert device_state.device_id == "F7DFE301A82C"
+    assert device_state.report_period == 150
+    assert device_state.state
+    measure = device_state.sensor_states[0].measure
+    assert measure == SensorMeasure(
+        type=None,
+        value=12.5,
+        unit=None,
+        date=datetime(2024, 7, 28, 18, 3, 14, tzinfo=UTC),
+    )
+
+
+def test_device_state_to_dict_round_trip() -> None:
+    """Test states are written back with their API names."""
+    payload = {
+        "deviceId": "F7DFE301A82C",
+        "effectiveReportPeriod": 150,
+        "state": "off",
+        "sensorStates": [
+            {
+                "sensorId": "F7DFE301A82C-pow",
+                "measure": {
+                    "type": "electric_power",
+                    "value": 0.0,
+                    "unit": "watt",
+                    "date": "2024-07-28 18:03:14",
+                },
+            }
+        ],
+    }
+
+    assert DeviceState.from_dict(payload).to_dict() == payload
+
+
+def test_profile_from_json_ignore_unknown_keys() -> None:
+    """Test profile model."""
+    profile = Profile.from_json(load_fixture("profile.json"))
+
+    assert profile == Profile(id="fake_user_id", grid_type="1 phase")
+
+
+def test_auth_and_master_device_aliases() -> None:
+    """Test aliased fields."""
+    assert Auth.from_dict({"authToken": "token"}).token == "token"
+    device = MasterDevice.from_dict(
+        {
+            "id": "F8DFE101A81C",
+            "name": "Master",
+            "type": "mst",
+            "deviceTypeId": "asoka_red_plug",
+            "state": "on",
+            "reportPeriod": 300,
+        }
+    )
+    assert device.report_period == 300
+    assert device.to_dict()["reportPeriod"] == 300
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        value
+        for value in vars(models).values()
+        if isinstance(value, type) and dataclasses.is_dataclass(value)
+    ],
+)
+def test_models_are_slotted(model: type) -> None:
+    """Test models don't carry a per-instance __dict__."""
+    assert "__slots__" in vars(model)
+    assert all("__dict__" not in vars(klass) for klass in model.__mro__)
+
+
+def test_device_state_memory_budget() -> None:
+    """Test the memory held per DeviceState snapshot."""
+    sensor_state = orjson.loads(load_fixture("states.json"))["deviceStates"][0][
+        "sensorStates"
+    ][0]
+    payloads = [
+        {
+            "deviceId": f"{index:012X}",
+            "effectiveReportPeriod": 150,
+            "state": "on",
+            "sensorStates": [sensor_state] * 3,
+        }
+        for index in range(1000)
+    ]
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        device_states = [DeviceState.from_dict(payload) for payload in payloads]
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    assert len(device_states) == 1000
+    assert used / 1000 < _DEVICE_STATE_MEMORY_BUDGET
@@ -0,0 +1,130 @@
+"""Tests for the poller."""
+
+import asyncio
+
+from aioresponses import aioresponses
+
+from mylightsystems import MyLightSystemsApiClient, MyLightSystemsUnauthorizedError
+from mylightsystems.models import Auth
+from mylightsystems.poller import MyLightSystemsPoller, PollResult
+from mylightsystems.transport import ReplayTransport
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+_STATES_URL = f"{MOCK_URL}/api/states"
+
+
+async def test_poller_queue_results_of_every_account(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test every account is polled and its period learnt from states."""
+    responses.get(
+        f"{_STATES_URL}?authToken=token-1",
+        status=200,
+        body=load_fixture("states.json"),
+    )
+    responses.get(
+        f"{_STATES_URL}?authToken=token-2",
+        status=200,
+        body=load_fixture("unauthorized.json"),
+    )
+    poller = MyLightSystemsPoller(client, stagger=False)
+    poller.add_account("one", Auth(token="token-1"), report_period=300)
+    poller.add_account("two", Auth(token="token-2"))
+
+    async with poller:
+        results: dict[str, PollResult] = {}
+        async for result in poller.results():
+            results[result.account] = result
+            if len(results) == 2:
+                break
+
+    assert results["one"].ok
+    assert results["one"].device_states is not None
+    assert len(results["one"].device_states) == 8
+    assert isinstance(results["two"].error, MyLightSystemsUnauthorizedError)
+    assert poller._accounts["one"].report_period == 150
+    assert all(state.task is None for state in poller._accounts.values())
+
+
+async def test_poller_call_callback(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test results are handed to the callback, even when it fails."""
+    responses.get(
+        f"{_STATES_URL}?authToken=token-1",
+        status=200,
+        body=load_fixture("states.json"),
+        repeat=True,
+    )
+    received = asyncio.Event()
+    accounts: list[str] = []
+
+    async def callback(result: PollResult) -> None:
+        accounts.append(result.account)
+        received.set()
+        raise RuntimeError
+
+    async with MyLightSystemsPoller(client, callback=callback, stagger=False) as poller:
+        poller.add_account("one", Auth(token="token-1"))
+        await asyncio.wait_for(received.wait(), 1)
+        poller.remove_account("one")
+
+    assert accounts == ["one"]
+    assert poller.accounts == []
+    assert poller.queue.empty()
+
+
+async def test_poller_keep_polling_after_unexpected_error() -> None:
+    """Test a malformed response is delivered and the account polled again."""
+    transport = ReplayTransport()
+    transport.add("/api/states", b'{"status":"error","error":"internal"}')
+
+    async with (
+        MyLightSystemsApiClient(MOCK_URL, transport=transport) as client,
+        MyLightSystemsPoller(client, stagger=False) as poller,
+    ):
+        poller.add_account("one", Auth(token="token-1"), report_period=0.01)
+        first = await asyncio.wait_for(poller.queue.get(), 1)
+        second = await asyncio.wait_for(poller.queue.get(), 1)
+
+    assert isinstance(first.error, KeyError)
+    assert isinstance(second.error, KeyError)
+
+
+async def test_poller_login_again_with_credentials(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test an account with credentials recovers from an expired token."""
+    responses.get(
+        f"{_STATES_URL}?authToken=expired-token",
+        status=200,
+        body=load_fixture("unauthorized.json"),
+    )
+    responses.get(
+        f"{MOCK_URL}/api/auth?email=user@example.com&password=secret",
+        status=200,
+        body=load_fixture("login_success.json"),
+    )
+    responses.get(
+        f"{_STATES_URL}?authToken=fake_auth_token",
+        status=200,
+        body=load_fixture("states.json"),
+    )
+    poller = MyLightSystemsPoller(client, stagger=False)
+    poller.add_account(
+        "one",
+        Auth(token="expired-token"),
+        credentials=("user@example.com", "secret"),
+    )
+
+    async with poller:
+        result = await asyncio.wait_for(poller.queue.get(), 1)
+
+    assert result.ok
+    auth = poller._accounts["one"].auth
+    assert auth is not None
+    assert auth.token == "fake_auth_token"
@@ -0,0 +1,84 @@
+"""Tests for the client-side rate limiter."""
+
+import asyncio
+
+import aiohttp
+from aioresponses import aioresponses
+
+from mylightsystems import MyLightSystemsApiClient
+from mylightsystems.rate_limit import RateLimiter, TokenBucket
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+
+async def test_token_bucket_burst_then_rate() -> None:
+    """Test the bucket lets a burst through, then paces requests."""
+    bucket = TokenBucket(rate=50, capacity=2)
+
+    waits = [await bucket.acquire() for _ in range(4)]
+
+    assert waits[0] == waits[1] == 0
+    assert all(wait > 0.01 for wait in waits[2:])
+    assert bucket.stats.acquired == 4
+    assert bucket.stats.delayed == 2
+    assert bucket.stats.max_wait >= bucket.stats.mean_wait > 0
+
+
+async def test_token_bucket_fifo() -> None:
+    """Test waiting callers are served in arrival order."""
+    bucket = TokenBucket(rate=100)
+    order: list[int] = []
+
+    async def _acquire(index: int) -> None:
+        await bucket.acquire()
+        order.append(index)
+
+    await asyncio.gather(*(_acquire(index) for index in range(5)))
+
+    assert order == [0, 1, 2, 3, 4]
+
+
+async def test_rate_limiter_per_token() -> None:
+    """Test each auth token has its own bucket."""
+    limiter = RateLimiter(per_token_rate=10)
+
+    assert await limiter.acquire("token-1") == 0
+    assert await limiter.acquire("token-2") == 0
+    assert await limiter.acquire() == 0
+    assert limiter.bucket("token-1") is not limiter.bucket("token-2")
+    assert limiter.stats.acquired == 3
+    assert limiter.stats.delayed == 0
+
+
+async def test_rate_limiter_evict_least_recently_used_tokens() -> None:
+    """Test rotated auth tokens don't keep their bucket forever."""
+    limiter = RateLimiter(per_token_rate=10, max_tokens=2)
+
+    for index in range(5):
+        await limiter.acquire(f"token-{index}")
+    await limiter.acquire("token-3")
+    await limiter.acquire("token-5")
+
+    assert list(limiter._buckets) == ["token-3", "token-5"]
+
+
+async def test_client_rate_limited(responses: aioresponses) -> None:
+    """Test the client waits for the rate limiter before each request."""
+    for _ in range(3):
+        responses.get(
+            f"{MOCK_URL}/api/states?authToken=fake-token",
+            status=200,
+            body=load_fixture("states.json"),
+        )
+    limiter = RateLimiter(rate=1000, per_token_rate=50)
+    async with aiohttp.ClientSession() as session, MyLightSystemsApiClient(
+        MOCK_URL, session=session, rate_limiter=limiter
+    ) as client:
+        for _ in range(3):
+            await client.get_states(auth_token="fake-token")
+
+    bucket = limiter.bucket("fake-token")
+    assert bucket is not None
+    assert bucket.stats.acquired == 3
+    assert bucket.stats.delayed == 2
+    assert limiter.stats.total_wait > 0
@@ -0,0 +1,79 @@
+"""Tests for the device registry."""
+
+from dataclasses import replace
+
+from aioresponses import aioresponses
+import orjson
+
+from mylightsystems import MyLightSystemsApiClient
+from mylightsystems.device_factory import default_device_factory
+from mylightsystems.models import CompositeCounterDevice, DeviceState, RelayDevice
+from mylightsystems.registry import DeviceRegistry
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+
+async def test_get_device_registry_indexes(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test devices are indexed by id, type, type id and master."""
+    responses.get(
+        f"{MOCK_URL}/api/devices?authToken=fake-token",
+        status=200,
+        body=load_fixture("devices.json"),
+    )
+
+    registry = await client.get_device_registry(auth_token="fake-token")
+
+    assert len(registry) == 8
+    assert "F8DFE101A81C" in registry
+    assert registry.get("unknown") is None
+    assert [device.id for device in registry.by_type("cmp")] == [
+        "B2F7E9A1C75E",
+        "71A3F0A1C75E",
+        "D8B4F1A1C75E",
+    ]
+    assert [device.id for device in registry.by_type_id("virtual")] == ["E9C5FA81C75E"]
+    relays = [
+        device
+        for device in registry.by_master("F8DFE101A81C")
+        if isinstance(device, RelayDevice)
+    ]
+    assert [relay.id for relay in relays] == ["4D9F3281C75E"]
+    composite = registry.get("4D9F3081C75E")
+    assert isinstance(composite, CompositeCounterDevice)
+    assert {child.id for child in registry.children(composite)} == {
+        device.id for device in registry.by_master("4D9F3081C75E")
+    }
+
+
+def test_registry_refresh_and_states() -> None:
+    """Test a refresh reports and reindexes the changed devices only."""
+    devices = [
+        default_device_factory.create_device(device)
+        for device in orjson.loads(load_fixture("devices.json"))["devices"]
+    ]
+    registry = DeviceRegistry.from_devices(devices)
+    device_state = DeviceState.from_dict(
+        orjson.loads(load_fixture("states.json"))["deviceStates"][0]
+    )
+    registry.update_states([replace(device_state, device_id="F8DFE101A81C")])
+    assert registry.state("F8DFE101A81C") is not None
+
+    relay = devices[0]
+    assert isinstance(relay, RelayDevice)
+    moved = replace(relay, master_id="E9C5FA81C75E")
+    changes = registry.refresh([moved, *devices[1:5], *devices[6:]])
+
+    assert changes.added == []
+    assert changes.updated == [relay.id]
+    assert changes.removed == ["F8DFE101A81C"]
+    assert registry.by_master("E9C5FA81C75E") == [moved]
+    assert registry.by_type("mst") == []
+    assert registry.state("F8DFE101A81C") is None
+    assert all(
+        state is None or state.device_id == device.id
+        for device, state in registry.with_states()
+    )
+    assert len(list(registry)) == 7
@@ -0,0 +1,190 @@
+"""Tests for retries and the circuit breaker."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+import aiohttp
+from aioresponses import aioresponses
+import pytest
+
+from mylightsystems import MyLightSystemsApiClient, MyLightSystemsConnectionError
+from mylightsystems.exceptions import MyLightSystemsCircuitOpenError
+from mylightsystems.retry import CircuitBreaker, RetryPolicy, default_retry_policies
+from mylightsystems.transport import ReplayTransport
+from tests import FakeClock, count_requests, load_fixture
+from tests.const import MOCK_URL
+
+_STATES_URL = f"{MOCK_URL}/api/states"
+_SWITCH_URL = f"{MOCK_URL}/api/device/switch"
+
+
+@pytest.fixture(name="retry_client")
+async def retry_client_fixture() -> AsyncGenerator[MyLightSystemsApiClient, None]:
+    """Return a client retrying without waiting."""
+    policies = default_retry_policies()
+    policies["/api/states"] = RetryPolicy(backoff_base=0, backoff_max=0)
+    async with aiohttp.ClientSession() as session, MyLightSystemsApiClient(
+        MOCK_URL, session=session, retry_policies=policies
+    ) as mylightsystems_client:
+        yield mylightsystems_client
+
+
+async def test_request_retry_transient_errors(
+    responses: aioresponses,
+    retry_client: MyLightSystemsApiClient,
+) -> None:
+    """Test server errors are retried until a success."""
+    responses.get(f"{_STATES_URL}?authToken=fake-token", status=503)
+    responses.get(f"{_STATES_URL}?authToken=fake-token", status=502)
+    responses.get(
+        f"{_STATES_URL}?authToken=fake-token",
+        status=200,
+        body=load_fixture("states.json"),
+    )
+
+    device_states = await retry_client.get_states(auth_token="fake-token")
+
+    assert len(device_states) == 8
+    assert count_requests(responses) == 3
+
+
+async def test_request_give_up_after_max_attempts(
+    responses: aioresponses,
+    retry_client: MyLightSystemsApiClient,
+) -> None:
+    """Test retries are bounded."""
+    responses.get(f"{_STATES_URL}?authToken=fake-token", status=500, repeat=True)
+
+    with pytest.raises(MyLightSystemsConnectionError):
+        await retry_client.get_states(auth_token="fake-token")
+
+    assert count_requests(responses) == 3
+
+
+@pytest.mark.parametrize("status", [400, 404])
+async def test_request_dont_retry_client_errors(
+    responses: aioresponses,
+    retry_client: MyLightSystemsApiClient,
+    status: int,
+) -> None:
+    """Test client errors fail at once."""
+    responses.get(f"{_STATES_URL}?authToken=fake-token", status=status, repeat=True)
+
+    with pytest.raises(MyLightSystemsConnectionError):
+        await retry_client.get_states(auth_token="fake-token")
+
+    assert count_requests(responses) == 1
+
+
+async def test_switch_not_retried_by_default(
+    responses: aioresponses,
+    retry_client: MyLightSystemsApiClient,
+) -> None:
+    """Test switching a device is sent once."""
+    responses.get(
+        f"{_SWITCH_URL}?authToken=fake-token&id=test&on=true", status=503, repeat=True
+    )
+
+    with pytest.raises(MyLightSystemsConnectionError):
+        await retry_client.switch(auth_token="fake-token", device_id="test", value=True)
+
+    assert count_requests(responses) == 1
+
+
+async def test_circuit_breaker_fail_fast_while_open(
+    responses: aioresponses,
+) -> None:
+    """Test the circuit opens after consecutive failures and recovers."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30, clock=clock)
+    responses.get(f"{_STATES_URL}?authToken=fake-token", status=500)
+    responses.get(f"{_STATES_URL}?authToken=fake-token", status=500)
+    responses.get(
+        f"{_STATES_URL}?authToken=fake-token",
+        status=200,
+        body=load_fixture("states.json"),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        client = MyLightSystemsApiClient(
+            MOCK_URL, session=session, circuit_breaker=breaker
+        )
+        for _ in range(2):
+            with pytest.raises(MyLightSystemsConnectionError):
+                await client.get_states(auth_token="fake-token")
+        assert breaker.state == "open"
+
+        with pytest.raises(MyLightSystemsCircuitOpenError):
+            await client.get_states(auth_token="fake-token")
+        assert count_requests(responses) == 2
+
+        clock.now = 30
+        assert breaker.state == "half-open"
+        await client.get_states(auth_token="fake-token")
+
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+
+
+async def test_circuit_breaker_half_open_lets_one_request_through() -> None:
+    """Test a half-open circuit only sends one test request at once."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30, clock=clock)
+    transport = ReplayTransport(latency=0.01)
+    transport.add("/api/states", b"", status=500)
+
+    async with MyLightSystemsApiClient(
+        MOCK_URL, transport=transport, circuit_breaker=breaker
+    ) as client:
+        with pytest.raises(MyLightSystemsConnectionError):
+            await client.get_states(auth_token="fake-token")
+        clock.now = 30
+        transport.add("/api/states", load_fixture("states.json").encode())
+
+        results = await asyncio.gather(
+            *(client.get_states(auth_token=f"token-{index}") for index in range(5)),
+            return_exceptions=True,
+        )
+
+    assert isinstance(results[0], list)
+    assert all(
+        isinstance(result, MyLightSystemsCircuitOpenError) for result in results[1:]
+    )
+    assert breaker.state == "closed"
+
+
+def test_circuit_breaker_released_test_request() -> None:
+    """Test an inconclusive test request lets another one through."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30, clock=clock)
+    breaker.record_failure()
+    clock.now = 30
+
+    assert breaker.before_request()
+    with pytest.raises(MyLightSystemsCircuitOpenError):
+        breaker.before_request()
+    breaker.release()
+    assert breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_retry_policy_delay() -> None:
+    """Test backoff growth, its cap and the Retry-After header."""
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=0)
+    error = MyLightSystemsConnectionError()
+
+    assert [policy.delay(error, attempt) for attempt in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+    error.__cause__ = aiohttp.ClientResponseError(
+        None,  # type: ignore[arg-type]
+        (),
+        status=429,
+        headers={"Retry-After": "3"},  # type: ignore[arg-type]
+    )
+    assert policy.delay(error, 1) == 3
+    assert policy.should_retry(error, 1)
+    assert not policy.should_retry(error, 3)
+
+    jittered = RetryPolicy(backoff_base=1, jitter=0.5)
+    assert 0.5 <= jittered.delay(MyLightSystemsConnectionError(), 1) <= 1
@@ -0,0 +1,85 @@
+"""Tests for the measure store."""
+
+from pathlib import Path
+
+import orjson
+import pytest
+
+from mylightsystems.models import DeviceState
+from mylightsystems.storage import MeasureStore
+from tests import load_fixture
+
+
+def test_store_append_across_chunks_and_reopen(tmp_path: Path) -> None:
+    """Test points spread over chunks survive reopening the store."""
+    points = [(1_000 + 150 * index, float(index)) for index in range(10)]
+
+    with MeasureStore(tmp_path, chunk_size=4) as store:
+        assert store.append("sensor/1", points[:3]) == 3
+        # Points not newer than the last one are skipped
+        assert store.append("sensor/1", points[2:]) == 7
+        assert store.append("sensor/1", points) == 0
+
+    assert len(list((tmp_path / "sensor%2F1").glob("*.chunk"))) == 3
+    with MeasureStore(tmp_path, chunk_size=4) as store:
+        series = store.series("sensor/1")
+        assert len(series) == 10
+        assert series.last_timestamp == points[-1][0]
+        assert list(store.range("sensor/1", 0, 10_000)) == points
+        assert list(store.range("sensor/1", 1_150, 1_750)) == points[1:5]
+        assert list(store.range("sensor/1", 5_000, 6_000)) == []
+        assert list(store.range("unknown", 0, 10_000)) == []
+
+
+def test_store_downsample(tmp_path: Path) -> None:
+    """Test statistics are computed per aligned bucket."""
+    with MeasureStore(tmp_path, chunk_size=3) as store:
+        store.append("sensor", [(0, 1.0), (100, 3.0), (600, 2.0), (650, 8.0)])
+
+        buckets = store.downsample("sensor", 0, 1_000, 300)
+
+    assert [(bucket.start, bucket.count) for bucket in buckets] == [(0, 2), (600, 2)]
+    assert (buckets[0].min, buckets[0].max, buckets[0].mean) == (1.0, 3.0, 2.0)
+    assert buckets[1].mean == pytest.approx(5.0)
+
+
+def test_store_append_states(tmp_path: Path) -> None:
+    """Test polled states are stored once per reading."""
+    device_states = [
+        DeviceState.from_dict(device_state)
+        for device_state in orjson.loads(load_fixture("states.json"))["deviceStates"]
+    ]
+    sensor_count = sum(len(state.sensor_states) for state in device_states)
+
+    with MeasureStore(tmp_path) as store:
+        assert store.append_states(device_states) == sensor_count
+        assert store.append_states(device_states) == 0
+
+        sensor_state = device_states[0].sensor_states[0]
+        timestamp = int(sensor_state.measure.date.timestamp())
+        assert list(store.range(sensor_state.sensor_id, timestamp, timestamp + 1)) == [
+            (timestamp, sensor_state.measure.value)
+        ]
+
+
+def test_store_bounds_open_series_and_chunks(tmp_path: Path) -> None:
+    """Test least recently used series and chunks are closed."""
+    with MeasureStore(tmp_path, chunk_size=2, max_open_series=3) as store:
+        for index in range(10):
+            store.append(f"sensor-{index}", [(1, 1.0), (2, 2.0), (3, 3.0)])
+        assert len(store._series) == 3
+
+        series = store.series("sensor-0")
+        series.max_open_chunks = 1
+        assert list(series.range(0, 10)) == [(1, 1.0), (2, 2.0), (3, 3.0)]
+        assert len(series._open) == 1
+        assert len(series) == 3
+
+
+def test_store_rejects_another_chunk_size(tmp_path: Path) -> None:
+    """Test chunks can't be read with another capacity than written."""
+    with MeasureStore(tmp_path) as store:
+        store.append("sensor", [(1, 1.0)])
+
+    with pytest.raises(ValueError, match="holds 16384 points, not 4"):
+        MeasureStore(tmp_path, chunk_size=4).series("sensor")
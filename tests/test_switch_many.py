@@ -0,0 +1,49 @@
+"""Tests for switch many."""
+
+from aioresponses import aioresponses
+import pytest
+
+from mylightsystems import MyLightSystemsApiClient
+from mylightsystems.exceptions import (
+    MyLightSystemsSwitchNotAllowedError,
+    MyLightSystemsUnknownDeviceError,
+)
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+_SWITCH_URL = f"{MOCK_URL}/api/device/switch"
+
+
+async def test_switch_many_capture_errors_per_device(
+    responses: aioresponses,
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test failing switches don't abort the batch."""
+    for device_id, value, fixture in (
+        ("a", "true", "switch.json"),
+        ("b", "false", "switch_not_allowed.json"),
+        ("c", "true", "switch_device_not_found.json"),
+    ):
+        responses.get(
+            f"{_SWITCH_URL}?authToken=fake-token&id={device_id}&on={value}",
+            status=200,
+            body=load_fixture(fixture),
+        )
+
+    results = await client.switch_many(
+        "fake-token", [("c", True), ("a", True), ("b", False)]
+    )
+
+    assert [result.key for result in results] == ["c", "a", "b"]
+    assert isinstance(results[0].error, MyLightSystemsUnknownDeviceError)
+    assert results[1].value is not None
+    assert results[1].value.state
+    assert isinstance(results[2].error, MyLightSystemsSwitchNotAllowedError)
+
+
+async def test_switch_many_reject_duplicate_devices(
+    client: MyLightSystemsApiClient,
+) -> None:
+    """Test a device listed twice isn't silently merged."""
+    with pytest.raises(ValueError, match="once per batch"):
+        await client.switch_many("fake-token", [("a", True), ("a", False)])
@@ -0,0 +1,74 @@
+"""Tests for the synchronous client."""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+from mylightsystems.exceptions import MyLightSystemsUnknownDeviceError
+from mylightsystems.sync import MyLightSystemsSyncClient
+from mylightsystems.transport import ReplayTransport
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+
+def _transport() -> ReplayTransport:
+    transport = ReplayTransport(latency=0.05)
+    transport.add("/api/states", load_fixture("states.json").encode())
+    transport.add("/api/devices", load_fixture("devices.json").encode())
+    for device_id, value, fixture in (
+        ("a", "true", "switch.json"),
+        ("b", "false", "switch_device_not_found.json"),
+    ):
+        transport.add(
+            "/api/device/switch",
+            load_fixture(fixture).encode(),
+            params={"id": device_id, "on": value},
+        )
+    return transport
+
+
+def test_blocking_calls() -> None:
+    """Test blocking calls run on the background loop."""
+    with MyLightSystemsSyncClient(MOCK_URL, transport=_transport()) as client:
+        assert client.get_states("fake-token")
+        assert client.get_devices("fake-token")
+        assert client.switch("fake-token", "a", True).state  # noqa: FBT003
+        with pytest.raises(MyLightSystemsUnknownDeviceError):
+            client.switch("fake-token", "b", False)  # noqa: FBT003
+
+
+def test_batched_calls_run_concurrently() -> None:
+    """Test batched calls overlap their requests on the loop."""
+    with MyLightSystemsSyncClient(MOCK_URL, transport=_transport()) as client:
+        started = time.perf_counter()
+        results = client.get_states_many([f"token-{index}" for index in range(20)])
+        elapsed = time.perf_counter() - started
+        assert all(result.value for result in results)
+        # 20 replays of 50ms, 4 at once take 0.25s, one at a time 1s
+        assert elapsed < 0.6
+
+        switched = client.switch_many("fake-token", [("a", True), ("b", False)])
+        assert switched[0].value is not None
+        assert isinstance(switched[1].error, MyLightSystemsUnknownDeviceError)
+
+
+def test_calls_from_many_threads() -> None:
+    """Test the client can be shared by threads."""
+    with (
+        MyLightSystemsSyncClient(MOCK_URL, transport=_transport()) as client,
+        ThreadPoolExecutor(8) as executor,
+    ):
+        states = list(executor.map(client.get_states, ["fake-token"] * 16))
+    assert all(device_states == states[0] for device_states in states)
+
+
+def test_close_stops_the_loop() -> None:
+    """Test closing stops the loop thread, once."""
+    client = MyLightSystemsSyncClient(MOCK_URL, transport=_transport())
+    thread = client._thread
+    client.close()
+    client.close()
+    assert not thread.is_alive()
+    assert not any(item is thread for item in threading.enumerate())
@@ -0,0 +1,87 @@
+"""Tests for the persistent device topology cache."""
+
+import asyncio
+from pathlib import Path
+
+import aiohttp
+from aioresponses import aioresponses
+import orjson
+
+from mylightsystems import MyLightSystemsApiClient
+from mylightsystems.topology import TopologyCache
+from tests import FakeClock, count_requests, load_fixture
+from tests.const import MOCK_URL
+
+_DEVICES_URL = f"{MOCK_URL}/api/devices?authToken=fake-token"
+
+
+async def test_topology_cached_then_revalidated(
+    responses: aioresponses, tmp_path: Path
+) -> None:
+    """Test a restart reads devices from disk and revalidates them when stale."""
+    clock = FakeClock()
+    cache = TopologyCache(tmp_path, max_age=60, clock=clock)
+    responses.get(_DEVICES_URL, status=200, body=load_fixture("devices.json"))
+
+    async with aiohttp.ClientSession() as session, MyLightSystemsApiClient(
+        MOCK_URL, session=session, topology_cache=cache
+    ) as client:
+        devices = await client.get_devices_cached("account", "fake-token")
+    assert count_requests(responses) == 1
+
+    # A restarted worker has an empty cache in memory
+    cache = TopologyCache(tmp_path, max_age=60, clock=clock)
+    async with aiohttp.ClientSession() as session, MyLightSystemsApiClient(
+        MOCK_URL, session=session, topology_cache=cache
+    ) as client:
+        assert await client.get_devices_cached("account", "fake-token") == devices
+        assert count_requests(responses) == 1
+
+        clock.now = 60
+        payload = orjson.loads(load_fixture("devices.json"))
+        payload["devices"] = payload["devices"][:2]
+        responses.get(_DEVICES_URL, status=200, body=orjson.dumps(payload))
+        assert await client.get_devices_cached("account", "fake-token") == devices
+        await asyncio.gather(*client._revalidations.values())
+
+    assert count_requests(responses) == 2
+    topology = TopologyCache(tmp_path, clock=clock).load("account")
+    assert topology is not None
+    assert topology.devices == devices[:2]
+    assert topology.saved_at == 60
+    assert not cache.is_stale(topology)
+
+
+def test_topology_ignore_unusable_files(tmp_path: Path) -> None:
+    """Test files of another version or corrupted are ignored."""
+    cache = TopologyCache(tmp_path)
+    assert cache.load("account") is None
+
+    cache.save("account", [])
+    path = cache.path("account")
+    assert "account" not in path.name
+    data = orjson.loads(path.read_bytes())
+    path.write_bytes(orjson.dumps({**data, "version": 0}))
+    assert cache.load("account") is None
+
+    path.write_bytes(b"{")
+    assert cache.load("account") is None
+
+
+def test_topology_save_unchanged_devices_touch_file(tmp_path: Path) -> None:
+    """Test saving the same devices only updates the save time."""
+    clock = FakeClock()
+    cache = TopologyCache(tmp_path, max_age=60, clock=clock)
+    cache.save("account", [])
+    path = cache.path("account")
+    path.write_bytes(path.read_bytes().replace(b"{", b"{ ", 1))
+
+    clock.now = 60
+    topology = cache.save("account", [])
+
+    assert path.read_bytes().startswith(b"{ ")
+    assert cache.get("account") is topology
+    loaded = TopologyCache(tmp_path, max_age=60, clock=clock).load("account")
+    assert loaded is not None
+    assert loaded.saved_at == 60
+    assert not cache.is_stale(loaded)
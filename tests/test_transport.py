@@ -0,0 +1,93 @@
+"""Tests for the record and replay transports."""
+
+from pathlib import Path
+
+import aiohttp
+from aioresponses import aioresponses
+import pytest
+
+from mylightsystems import MyLightSystemsApiClient, MyLightSystemsConnectionError
+from mylightsystems.transport import RecordingTransport, ReplayTransport
+from tests import load_fixture
+from tests.const import MOCK_URL
+
+
+async def test_record_then_replay(responses: aioresponses, tmp_path: Path) -> None:
+    """Test recorded responses are replayed without network."""
+    responses.get(
+        f"{MOCK_URL}/api/states?authToken=secret-token",
+        status=200,
+        body=load_fixture("states.json"),
+    )
+    responses.get(
+        f"{MOCK_URL}/api/measures/total?authToken=secret-token&device_id=a",
+        status=503,
+        headers={"Retry-After": "7", "Set-Cookie": "session=secret-cookie"},
+    )
+    responses.get(
+        f"{MOCK_URL}/api/auth?email=user@example.com&password=secret-password",
+        status=200,
+        body='{"status": "ok", "authToken": "secret-token"}',
+    )
+    responses.get(
+        f"{MOCK_URL}/api/profile?authToken=secret-token",
+        status=200,
+        body=load_fixture("profile.json"),
+    )
+    cassette = tmp_path / "responses.json"
+
+    async with aiohttp.ClientSession() as session:
+        recorder = RecordingTransport(session)
+        async with MyLightSystemsApiClient(MOCK_URL, transport=recorder) as client:
+            await client.login("user@example.com", "secret-password")
+            profile = await client.get_profile()
+            recorded = await client.get_states(auth_token="secret-token")
+            with pytest.raises(MyLightSystemsConnectionError):
+                await client.get_measures_total("secret-token", "a")
+        recorder.save(cassette)
+
+    content = cassette.read_text()
+    for secret in (
+        "secret-token",
+        "secret-password",
+        "secret-cookie",
+        "user@example.com",
+        "fake_email@fake.fr",
+        "01 02 03 04 05",
+        "10 rue de la gare",
+    ):
+        assert secret not in content
+
+    replay = ReplayTransport.load(cassette)
+    async with MyLightSystemsApiClient(MOCK_URL, transport=replay) as client:
+        assert await client.get_states(auth_token="other-token") == recorded
+        assert [
+            state async for state in client.iter_states(auth_token="other-token")
+        ] == recorded
+        assert await client.get_profile(auth_token="other-token") == profile
+        auth = await client.auth("other@example.com", "other-password")
+        assert auth.token == "redacted"
+        with pytest.raises(MyLightSystemsConnectionError) as error:
+            await client.get_measures_total("other-token", "a")
+        assert isinstance(error.value.__cause__, aiohttp.ClientResponseError)
+        assert error.value.__cause__.status == 503
+        assert error.value.__cause__.headers is not None
+        assert error.value.__cause__.headers["Retry-After"] == "7"
+        with pytest.raises(MyLightSystemsConnectionError):
+            await client.get_devices(auth_token="other-token")
+        assert client.session is None
+
+
+async def test_replay_added_responses() -> None:
+    """Test responses can be served from memory."""
+    replay = ReplayTransport()
+    replay.add(
+        "/api/measures/total",
+        load_fixture("measures_total.json").encode(),
+        params={"device_id": "a"},
+    )
+
+    async with MyLightSystemsApiClient(MOCK_URL, transport=replay) as client:
+        measures = await client.get_measures_total("fake-token", "a")
+
+    assert len(measures) == 2